@@ -1,14 +1,27 @@
 # downloader.py - Optimized downloader implementation
 
+import atexit
 import os
 import time
-from typing import Optional, Dict, Any
+import logging
+import queue
+import random
+import signal
+import threading
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import replace
 from yt_dlp import YoutubeDL
 import re
 from pathlib import Path
 from datetime import datetime
 import json
 import csv
+import io
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 from src.data.models import (
     DownloadConfig, PlaylistInfo, DownloadProgress, 
@@ -16,6 +29,176 @@ from src.data.models import (
 )
 from src.core.interfaces import ProgressListener
 
+# Use orjson for metadata serialization if installed, with stdlib fallback
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _encode = json.JSONEncoder(indent=2, ensure_ascii=False, separators=(',', ': ')).encode
+    
+    def _dumps(obj: Any) -> bytes:
+        return _encode(obj).encode('utf-8')
+
+# yt-dlp options that change per playlist and are re-applied to pooled YoutubeDL instances
+_PER_CALL_YDL_OPTS = ('outtmpl', 'progress_hooks')
+
+# Idle YoutubeDL instances kept per option set; extras are closed when returned
+_YDL_POOL_MAX_IDLE = 2
+
+@lru_cache(maxsize=64)
+def _join_template(folder: str, template: str) -> str:
+    """Resolve an output template against a playlist folder (memoized per pair)"""
+    return os.path.join(folder, template)
+
+
+class _QuietYdlLogger:
+    """yt-dlp logger that drops debug/warning output and forwards errors.
+    
+    One instance per downloader, so it keeps the YoutubeDL pool key stable.
+    """
+    
+    def __init__(self, logger):
+        self._logger = logger
+    
+    def debug(self, msg):
+        pass  # Suppress debug messages
+    
+    def warning(self, msg):
+        pass  # Suppress warnings
+    
+    def error(self, msg):
+        self._logger.error("yt-dlp error: %s", msg)
+
+
+# Per-video fields copied into the playlist metadata when yt-dlp provides them
+_OPTIONAL_VIDEO_FIELDS = ('channel', 'uploader', 'uploader_id', 'channel_id', 'channel_url')
+
+
+class _MergePipeline:
+    """Merges separately downloaded video/audio streams on a worker thread
+    so one item's merge overlaps with the next item's download"""
+    
+    def __init__(self, logger, output_format: str, parts_per_item: int, is_cancelled,
+                 tracked_pids: set):
+        self.logger = logger
+        self.output_format = output_format
+        self.parts_per_item = parts_per_item
+        self._is_cancelled = is_cancelled
+        self._tracked_pids = tracked_pids  # Shared with the downloader for force_stop
+        self._pending: Dict[str, list] = {}  # {video_id: [(filename, has_video, has_audio), ...]}
+        self.errors: list = []  # Failed merges, reported when the pipeline is closed
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def progress_hook(self, d: Dict[str, Any]) -> None:
+        """yt-dlp progress hook - hands complete items to the merge worker"""
+        if d.get('status') != 'finished' or not d.get('filename'):
+            return
+        
+        info = d.get('info_dict') or {}
+        key = info.get('id') or d['filename']
+        parts = self._pending.setdefault(key, [])
+        parts.append((
+            d['filename'],
+            info.get('vcodec') not in (None, 'none'),
+            info.get('acodec') not in (None, 'none')
+        ))
+        
+        if len(parts) >= self.parts_per_item:
+            del self._pending[key]
+            self._queue.put(parts)
+    
+    def match_filter(self, prepare_filename, base_template: str):
+        """yt-dlp match_filter that skips items whose merged file already exists,
+        so a retried download doesn't fetch finished items again"""
+        def skip_merged(info: Dict[str, Any], *, incomplete: bool = False) -> Optional[str]:
+            if incomplete:
+                return None
+            final_path = f"{prepare_filename(info, outtmpl=base_template)}.{self.output_format}"
+            if os.path.exists(final_path):
+                return f"{os.path.basename(final_path)} has already been downloaded and merged"
+            return None
+        
+        return skip_merged
+    
+    def join(self) -> None:
+        """Wait until every item handed over so far has been merged"""
+        self._queue.join()
+    
+    def close(self) -> list:
+        """Flush incomplete items, wait for outstanding merges and return the errors"""
+        # Items where only some streams downloaded (or a single-file fallback format
+        # was picked) are finalized as-is
+        for parts in self._pending.values():
+            self._queue.put(parts)
+        self._pending.clear()
+        
+        self._queue.put(None)
+        self._thread.join()
+        return self.errors
+    
+    def _run(self) -> None:
+        """Worker loop consuming downloaded items"""
+        while True:
+            parts = self._queue.get()
+            try:
+                if parts is None:
+                    break
+                if self._is_cancelled():
+                    continue
+                self._merge(parts)
+            except Exception as e:
+                # Part files are left in place so a retry can merge them again
+                self.logger.error("Error merging %s: %s", [p[0] for p in parts], e)
+                self.errors.append(f"Merging {os.path.basename(parts[0][0])} failed: {e}")
+            finally:
+                self._queue.task_done()
+    
+    def _merge(self, parts: list) -> None:
+        """Merge the streams of one item into the final output file"""
+        # Video stream first so it is mapped as the primary input
+        parts.sort(key=lambda p: not p[1])
+        inputs = [p[0] for p in parts]
+        base, ext = os.path.splitext(inputs[0])
+        base = re.sub(r'\.f[^.\\/]+$', '', base)  # Strip the ".f<format_id>" suffix
+        
+        if len(inputs) == 1:
+            os.replace(inputs[0], base + ext)
+            return
+        
+        # Take the video from the first input that has video and the audio from the
+        # first that has audio; copying only works if the container takes both codecs
+        video_index = next((i for i, p in enumerate(parts) if p[1]), None)
+        audio_index = next((i for i, p in enumerate(parts) if p[2]), None)
+        if video_index is None or audio_index is None:
+            raise RuntimeError("Downloaded streams are missing video or audio")
+        
+        final_path = f"{base}.{self.output_format}"
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error']
+        for path in inputs:
+            cmd += ['-i', path]
+        cmd += ['-map', f'{video_index}:v:0', '-map', f'{audio_index}:a:0', '-c', 'copy', final_path]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._tracked_pids.add(process.pid)
+        try:
+            _, stderr = process.communicate()
+        finally:
+            self._tracked_pids.discard(process.pid)
+        if process.returncode != 0:
+            # Don't leave a half-written output that would count as merged on retry
+            try:
+                os.remove(final_path)
+            except OSError:
+                pass
+            raise RuntimeError(f"ffmpeg exited with {process.returncode}: {stderr.decode(errors='ignore').strip()}")
+        
+        for path in inputs:
+            os.remove(path)
+        self.logger.debug("Merged %s streams into %s", len(inputs), final_path)
+
 
 class YouTubePlaylistDownloader:
     """Core YouTube playlist downloader implementation"""
@@ -34,11 +217,192 @@ class YouTubePlaylistDownloader:
         self.pause_requested = False
         self.current_download = None
         
-        # For progress throttling
-        self._last_progress_time = 0
+        # For progress throttling (time.monotonic() and whole-percent based), kept per
+        # playlist since playlists download concurrently: id -> (last emit time, last percent)
+        self._last_progress: Dict[str, Tuple[float, int]] = {}
+        
+        # Per-playlist DownloadProgress templates for the progress hooks
+        self._progress_templates: Dict[str, DownloadProgress] = {}
+        
+        # Last (filename, basename) pair seen by the progress hooks
+        self._last_filename = (None, 'unknown')
+        
+        # Directories already created by this instance (avoids repeated makedirs walks)
+        self._ensured_dirs: set = set()
+        
+        # PIDs of child processes we spawned, so force_stop can kill them directly
+        self._tracked_pids: set = set()
+        
+        # Merge pipelines of playlists being downloaded, so a pause can wait for them
+        self._merge_pipelines: Dict[str, _MergePipeline] = {}
+        
+        # Metadata files are generated off the download path
+        self._bg_pool = ThreadPoolExecutor(max_workers=2)
+        self._metadata_futures: Dict[str, Future] = {}
+        
+        # Idle YoutubeDL instances keyed by their options, so consecutive playlists
+        # skip YoutubeDL setup and reuse the same HTTP connections
+        self._ydl_cache: Dict[str, list] = {}
+        self._ydl_cache_lock = threading.Lock()
+        self._ydl_logger = _QuietYdlLogger(logger)
+        atexit.register(self.close_pooled)  # Lets YoutubeDL save cookies and close connections
+        
+        # Progress updates from yt-dlp hooks are handed to a dispatcher thread
+        # so a slow UI listener never stalls the download thread
+        self._progress_q: queue.Queue = queue.Queue(maxsize=100)
+        threading.Thread(target=self._progress_dispatch_loop, daemon=True).start()
+    
+    def _progress_template(self, playlist_id: str) -> DownloadProgress:
+        """Get the cached base DownloadProgress for a playlist, to be copied with replace()"""
+        template = self._progress_templates.get(playlist_id)
+        if template is None:
+            template = DownloadProgress(
+                playlist_id=playlist_id,
+                status=DownloadStatus.DOWNLOADING,
+                progress=0,
+                speed=0,
+                eta=0,
+                current_file="",
+                message=""
+            )
+            self._progress_templates[playlist_id] = template
+        return template
+    
+    def _basename(self, filename: Optional[str], default: str = 'unknown') -> str:
+        """Basename of a progress-hook filename, recomputed only when it changes"""
+        if not filename:
+            return default
+        # Read and replace the pair as a whole so concurrent downloads never mix them up
+        last_filename, last_basename = self._last_filename
+        if filename != last_filename:
+            last_basename = os.path.basename(filename)
+            self._last_filename = (filename, last_basename)
+        return last_basename
+    
+    def _is_duplicate(self, playlist_id: str) -> bool:
+        """Check whether a playlist was already completed"""
+        # The repository keeps its own completed-ID set, which clearing the history resets
+        if hasattr(self.history_repository, 'is_duplicate'):
+            return self.history_repository.is_duplicate(playlist_id)
+        return self.history_repository.find_by_playlist_id(playlist_id) is not None
     
     @staticmethod
-    def sanitize_filepath(filepath):
+    def _make_history_entry(playlist_id: str, title: str, status: str, path: str) -> Dict[str, Any]:
+        """Build a history entry dict stamped with the current time"""
+        return {
+            'playlist_id': playlist_id,
+            'playlist_title': title,
+            'status': status,
+            'timestamp': datetime.now().isoformat(),
+            'download_path': path
+        }
+    
+    def _save_history(self, entry: Dict[str, Any]) -> None:
+        """Save a history entry; the repository debounces and batches the file writes"""
+        try:
+            # Entries are plain dicts with ISO timestamps, so skip conversion when possible
+            if hasattr(self.history_repository, 'save_entry_dict'):
+                self.history_repository.save_entry_dict(entry)
+            else:
+                self.history_repository.save_entry(entry)
+        except Exception as e:
+            self.logger.error("Failed to save history: %s", e)
+    
+    @contextmanager
+    def _pooled_ydl(self, ydl_opts: Dict[str, Any]):
+        """Borrow an idle YoutubeDL built with matching options, creating one if none is free.
+        
+        Per-call options (output template, progress hooks) are excluded from the
+        pool key and re-applied to a reused instance.
+        """
+        key = repr(sorted((k, v) for k, v in ydl_opts.items() if k not in _PER_CALL_YDL_OPTS))
+        with self._ydl_cache_lock:
+            idle = self._ydl_cache.setdefault(key, [])
+            ydl = idle.pop() if idle else None
+        
+        if ydl is None:
+            ydl = YoutubeDL(ydl_opts)
+        else:
+            if 'outtmpl' in ydl_opts:
+                outtmpl = ydl_opts['outtmpl']
+                ydl.params['outtmpl'] = outtmpl if isinstance(outtmpl, dict) else {'default': outtmpl}
+            for hook in ydl_opts.get('progress_hooks', []):
+                ydl.add_progress_hook(hook)
+        
+        try:
+            yield ydl
+        except BaseException:
+            # Don't return an instance that may be in a bad state
+            ydl.close()
+            raise
+        
+        # Drop this call's hooks so the pooled instance doesn't keep them alive
+        ydl._progress_hooks.clear()
+        with self._ydl_cache_lock:
+            idle = self._ydl_cache[key]
+            if len(idle) < _YDL_POOL_MAX_IDLE:
+                idle.append(ydl)
+                return
+        ydl.close()
+    
+    def close_pooled(self) -> None:
+        """Close every idle pooled YoutubeDL instance"""
+        with self._ydl_cache_lock:
+            idle = [ydl for instances in self._ydl_cache.values() for ydl in instances]
+            self._ydl_cache.clear()
+        for ydl in idle:
+            try:
+                ydl.close()
+            except Exception as e:
+                self.logger.error("Error closing YoutubeDL instance: %s", e)
+    
+    def _emit_progress(self, callback: ProgressListener, update: DownloadProgress,
+                       final: bool = False) -> None:
+        """Queue a progress update for the dispatcher; intermediate ticks are dropped when full"""
+        if final:
+            self._progress_q.put((callback, update))
+            return
+        try:
+            self._progress_q.put_nowait((callback, update))
+        except queue.Full:
+            pass
+    
+    def _progress_dispatch_loop(self) -> None:
+        """Deliver queued progress updates, keeping only the latest per playlist"""
+        while True:
+            first = self._progress_q.get()
+            latest = {first[1].playlist_id: first}
+            count = 1
+            
+            # Coalesce everything already waiting
+            while True:
+                try:
+                    item = self._progress_q.get_nowait()
+                except queue.Empty:
+                    break
+                latest[item[1].playlist_id] = item
+                count += 1
+            
+            for callback, update in latest.values():
+                try:
+                    callback.on_progress(update)
+                except Exception as e:
+                    self.logger.error("Error in progress listener: %s", e)
+            
+            for _ in range(count):
+                self._progress_q.task_done()
+    
+    def _flush_progress(self) -> None:
+        """Block until queued progress updates have been delivered"""
+        self._progress_q.join()
+    
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once per instance, skipping paths already ensured"""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
+    def sanitize_filepath(self, filepath):
         """
         Thoroughly sanitize a file path to ensure it's valid across all platforms.
         - Replaces invalid characters
@@ -52,7 +416,7 @@ class YouTubePlaylistDownloader:
         directory_path = Path(directory)
         
         # Ensure directory exists
-        os.makedirs(directory_path, exist_ok=True)
+        self._ensure_dir(str(directory_path))
         
         # Replace invalid characters in filename with underscores
         # This is more thorough than most sanitization functions
@@ -74,111 +438,20 @@ class YouTubePlaylistDownloader:
                 progress_callback: Optional[ProgressListener] = None) -> None:
         """Download a playlist"""
         self.current_download = playlist_id
-        attempts = 0
-        playlist_info = None
-        
-        # Check if this is quick mode
-        quick_mode = getattr(config, 'quick_mode', False)
-        
-        while attempts < config.retry_count:
-            if self.pause_requested:
-                self._handle_pause(playlist_id, progress_callback)
-            
-            # Check for cancellation
-            if hasattr(self, '_force_cancel') and self._force_cancel:
-                self.logger.info(f"Download cancelled: {playlist_id}")
-                if progress_callback:
-                    progress_callback.on_progress(DownloadProgress(
-                        playlist_id=playlist_id,
-                        status=DownloadStatus.FAILED,
-                        progress=0,
-                        speed=0,
-                        eta=0,
-                        current_file="",
-                        message="Download cancelled"
-                    ))
-                return  # Exit early without raising exception
-
-            try:
-                # Check for duplicates if enabled and not in quick mode
-                if config.check_duplicates and not quick_mode:
-                    # Use is_duplicate method if available
-                    if hasattr(self.history_repository, 'is_duplicate'):
-                        is_duplicate = self.history_repository.is_duplicate(playlist_id)
-                    else:
-                        # Fall back to old method
-                        existing = self.history_repository.find_by_playlist_id(playlist_id)
-                        is_duplicate = existing is not None
-                        
-                    if is_duplicate:
-                        self.logger.info(f"Skipping duplicate: {playlist_id}")
-                        if progress_callback:
-                            progress_callback.on_download_complete(playlist_id)
-                        return
-                
-                # Get playlist info - use minimal mode if configured or in quick mode
-                skip_metadata = getattr(config, 'skip_metadata', False) or quick_mode
-                playlist_info = self.get_playlist_info(playlist_id, minimal=skip_metadata)
-                
-                # Create download directory
-                playlist_folder = self._create_playlist_folder(
-                    config.download_directory, 
-                    playlist_info.title
-                )
-                
-                # Create marker file (only in normal mode)
-                if not quick_mode:
-                    self._create_marker_file(playlist_folder, playlist_id)
-                
-                # Download playlist
-                self._download_playlist(
-                    playlist_info, 
-                    playlist_folder, 
-                    config, 
-                    progress_callback
-                )
-                
-                # Save to history - use dict instead of HistoryEntry
-                history_dict = {
-                    'playlist_id': playlist_id,
-                    'playlist_title': playlist_info.title,
-                    'status': 'completed',
-                    'timestamp': datetime.now().isoformat(),
-                    'download_path': playlist_folder
-                }
-                
-                # Use history_repository directly with a dict
-                try:
-                    # Create dict-based history
-                    self.history_repository.save_entry({
-                        'playlist_id': playlist_id,
-                        'playlist_title': playlist_info.title,
-                        'status': 'completed',
-                        'timestamp': datetime.now().isoformat(),
-                        'download_path': playlist_folder
-                    })
-                except Exception as e:
-                    self.logger.error(f"Failed to save history: {e}")
-                
-                if progress_callback:
-                    progress_callback.on_download_complete(playlist_id)
-                
-                return  # Success
-                
-            except Exception as e:
-                attempts += 1
-                error_msg = str(e)
-                self.logger.error(f"Attempt {attempts} failed for {playlist_id}: {error_msg}")
+        try:
+            attempts = 0
+            playlist_info = None
+            
+            # Check if this is quick mode
+            quick_mode = getattr(config, 'quick_mode', False)
+            
+            while attempts < config.retry_count:
+                if self.pause_requested:
+                    self._handle_pause(playlist_id, progress_callback)
                 
-                # Check for specific YouTube bot detection error
-                if "Sign in to confirm you're not a bot" in error_msg:
-                    special_error = (
-                        "YouTube bot detection triggered. Please:\n"
-                        "1. Go to Settings tab and set up cookie authentication\n"
-                        "2. Either use a browser cookie method or export cookies.txt from your browser\n"
-                        "3. Make sure you're logged in to YouTube in the browser you export cookies from\n"
-                        "4. Save settings and try again"
-                    )
+                # Check for cancellation
+                if hasattr(self, '_force_cancel') and self._force_cancel:
+                    self.logger.info("Download cancelled: %s", playlist_id)
                     if progress_callback:
                         progress_callback.on_progress(DownloadProgress(
                             playlist_id=playlist_id,
@@ -187,27 +460,99 @@ class YouTubePlaylistDownloader:
                             speed=0,
                             eta=0,
                             current_file="",
-                            message=special_error
+                            message="Download cancelled"
                         ))
-                
-                if attempts >= config.retry_count:
-                    # Save failed entry to history using dict
-                    try:
-                        self.history_repository.save_entry({
-                            'playlist_id': playlist_id,
-                            'playlist_title': getattr(playlist_info, 'title', playlist_id) if playlist_info else playlist_id,
-                            'status': 'failed',
-                            'timestamp': datetime.now().isoformat(),
-                            'download_path': config.download_directory
-                        })
-                    except Exception as history_err:
-                        self.logger.error(f"Failed to save history: {history_err}")
+                    return  # Exit early without raising exception
+
+                try:
+                    # Check for duplicates if enabled and not in quick mode
+                    if config.check_duplicates and not quick_mode:
+                        if self._is_duplicate(playlist_id):
+                            self.logger.info("Skipping duplicate: %s", playlist_id)
+                            if progress_callback:
+                                progress_callback.on_download_complete(playlist_id)
+                            return
+                    
+                    # Get playlist info - use minimal mode if configured or in quick mode
+                    skip_metadata = getattr(config, 'skip_metadata', False) or quick_mode
+                    playlist_info = self.get_playlist_info(playlist_id, minimal=skip_metadata)
+                    
+                    # Create download directory
+                    playlist_folder = self._create_playlist_folder(
+                        config.download_directory, 
+                        playlist_info.title
+                    )
+                    
+                    # Create marker file (only in normal mode)
+                    if not quick_mode:
+                        self._create_marker_file(playlist_folder, playlist_id)
+                    
+                    # Download playlist
+                    self._download_playlist(
+                        playlist_info, 
+                        playlist_folder, 
+                        config, 
+                        progress_callback
+                    )
+                    
+                    # The repository writes history in the background
+                    self._save_history(self._make_history_entry(
+                        playlist_id, playlist_info.title, 'completed', playlist_folder
+                    ))
                     
                     if progress_callback:
-                        progress_callback.on_download_error(playlist_id, str(e))
-                    raise
-                
-                time.sleep(2)  # Wait before retry
+                        progress_callback.on_download_complete(playlist_id)
+                    
+                    return  # Success
+                    
+                except Exception as e:
+                    attempts += 1
+                    error_msg = str(e)
+                    self.logger.error("Attempt %s failed for %s: %s", attempts, playlist_id, error_msg)
+                    
+                    # Check for specific YouTube bot detection error
+                    if "Sign in to confirm you're not a bot" in error_msg:
+                        special_error = (
+                            "YouTube bot detection triggered. Please:\n"
+                            "1. Go to Settings tab and set up cookie authentication\n"
+                            "2. Either use a browser cookie method or export cookies.txt from your browser\n"
+                            "3. Make sure you're logged in to YouTube in the browser you export cookies from\n"
+                            "4. Save settings and try again"
+                        )
+                        if progress_callback:
+                            progress_callback.on_progress(DownloadProgress(
+                                playlist_id=playlist_id,
+                                status=DownloadStatus.FAILED,
+                                progress=0,
+                                speed=0,
+                                eta=0,
+                                current_file="",
+                                message=special_error
+                            ))
+                        
+                        # Retrying without cookies cannot succeed - fail fast
+                        attempts = config.retry_count
+                    
+                    if attempts >= config.retry_count:
+                        # Save failed entry to history using dict
+                        self._save_history(self._make_history_entry(
+                            playlist_id,
+                            getattr(playlist_info, 'title', playlist_id) if playlist_info else playlist_id,
+                            'failed',
+                            config.download_directory
+                        ))
+                        
+                        if progress_callback:
+                            progress_callback.on_download_error(playlist_id, str(e))
+                        raise
+                    
+                    # Exponential backoff with jitter before retrying
+                    time.sleep(min(30, 0.5 * (2 ** attempts)) + random.uniform(0, 0.5))
+        finally:
+            # Metadata files are written in the background; make sure they are done
+            self._wait_for_metadata(playlist_id)
+            self._progress_templates.pop(playlist_id, None)
+            self._last_progress.pop(playlist_id, None)
 
 
     def download_quick(self, playlist_id: str, config: DownloadConfig,
@@ -235,35 +580,41 @@ class YouTubePlaylistDownloader:
             # Get minimal playlist info - enough to get the title and basic metadata
             ydl_opts = {
                 'quiet': True,
+                'no_warnings': True,
                 'extract_flat': 'in_playlist',  # We need entry info for metadata
                 'skip_download': True,
                 'playlist_items': '0:10',  # Get info for first 10 videos at most for speed
+                # Skip streaming manifests - only titles/ids are needed here
+                'extractor_args': {'youtube': {'skip': ['dash', 'hls', 'translated_subs']}},
+                'youtube_include_dash_manifest': False,
+                'youtube_include_hls_manifest': False,
             }
             
             playlist_title = f"Playlist_{playlist_id}"  # Default fallback title
             playlist_entries = []  # Default empty entries list
+            info = None
             
             try:
                 # Quick extraction for title and first few entries
-                with YoutubeDL(ydl_opts) as ydl:
+                with self._pooled_ydl(ydl_opts) as ydl:
                     info = ydl.extract_info(playlist_url, download=False)
                     if info:
                         if 'title' in info:
                             raw_title = info.get('title')
                             # Sanitize the title
                             playlist_title = self.filename_sanitizer._sanitize_filename_component(raw_title)
-                            self.logger.debug(f"Got playlist title: {playlist_title}")
+                            self.logger.debug("Got playlist title: %s", playlist_title)
                         
                         # Get entries for metadata
                         if 'entries' in info:
                             playlist_entries = info.get('entries', [])
             except Exception as e:
                 # If title extraction fails, just use the ID
-                self.logger.warning(f"Couldn't get playlist info, using ID: {e}")
+                self.logger.warning("Couldn't get playlist info, using ID: %s", e)
             
             # Create download directory with the title we got
             download_folder = os.path.join(config.download_directory, playlist_title)
-            os.makedirs(download_folder, exist_ok=True)
+            self._ensure_dir(download_folder)
             
             # Create a playlist info object with what we have
             playlist_info = PlaylistInfo(
@@ -271,26 +622,25 @@ class YouTubePlaylistDownloader:
                 title=playlist_title,
                 url=playlist_url,
                 total_tracks=len(playlist_entries),
-                entries=playlist_entries
+                entries=playlist_entries,
+                raw_info=info
             )
             
-            # Generate metadata files
-            self._generate_playlist_metadata_file(playlist_info, download_folder, config)
+            # Generate metadata files in the background while the download starts
+            self._submit_metadata(playlist_info, download_folder, config)
             
             # Download directly with optimized options
-            self._download_playlist_quick(playlist_info, download_folder, config, progress_callback)
+            try:
+                self._download_playlist_quick(playlist_info, download_folder, config, progress_callback)
+            finally:
+                self._wait_for_metadata(playlist_id)
+                self._progress_templates.pop(playlist_id, None)
+                self._last_progress.pop(playlist_id, None)
             
             # Save to history in the background
-            try:
-                self.history_repository.save_entry({
-                    'playlist_id': playlist_id,
-                    'playlist_title': playlist_title,
-                    'status': 'completed',
-                    'timestamp': datetime.now().isoformat(),
-                    'download_path': download_folder
-                })
-            except Exception as e:
-                self.logger.error(f"Failed to save history: {e}")
+            self._save_history(self._make_history_entry(
+                playlist_id, playlist_title, 'completed', download_folder
+            ))
             
             if progress_callback:
                 progress_callback.on_download_complete(playlist_id)
@@ -307,12 +657,29 @@ class YouTubePlaylistDownloader:
         # Set a flag to track cancellation
         self._force_cancel = True
         
-        # Try to terminate any active subprocess
-        # yt-dlp usually spawns ffmpeg or other processes that need to be killed
+        # Terminate the merge processes we spawned ourselves
+        tracked_pids = list(self._tracked_pids)
+        for pid in tracked_pids:
+            try:
+                self.logger.info("Terminating tracked child process: %s", pid)
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass  # Already exited
+        self._tracked_pids.difference_update(tracked_pids)
+        
+        # Then scan for the rest - yt-dlp spawns its own ffmpeg/aria2c processes
+        # that we never see the PIDs of
+        self._terminate_child_processes()
+        
+        # If the current download is active, we need to handle that
+        if self.current_download:
+            self.logger.info("Marking current download as cancelled: %s", self.current_download)
+            self.current_download = None
+        
+    def _terminate_child_processes(self) -> None:
+        """Scan the process tree for yt-dlp/ffmpeg children and terminate them"""
         try:
             import psutil
-            import os
-            import signal
             
             # Get our process and its children
             current_process = psutil.Process(os.getpid())
@@ -321,19 +688,14 @@ class YouTubePlaylistDownloader:
             for child in current_process.children(recursive=True):
                 try:
                     child_name = child.name().lower()
-                    if 'yt-dlp' in child_name or 'ffmpeg' in child_name or 'youtube-dl' in child_name:
-                        self.logger.info(f"Terminating child process: {child.pid} ({child_name})")
+                    if any(name in child_name for name in ('yt-dlp', 'ffmpeg', 'youtube-dl', 'aria2c')):
+                        self.logger.info("Terminating child process: %s (%s)", child.pid, child_name)
                         child.terminate()
                 except:
                     pass
         except Exception as e:
-            self.logger.error(f"Error trying to terminate processes: {e}")
-        
-        # If the current download is active, we need to handle that
-        if self.current_download:
-            self.logger.info(f"Marking current download as cancelled: {self.current_download}")
-            self.current_download = None
-        
+            self.logger.error("Error trying to terminate processes: %s", e)
+    
     def get_playlist_info(self, playlist_id: str, minimal: bool = False) -> PlaylistInfo:
         """Get playlist metadata with lazy fetching option"""
         playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
@@ -351,11 +713,16 @@ class YouTubePlaylistDownloader:
         # Original implementation for standard downloads
         ydl_opts = {
             'quiet': True,
+            'no_warnings': True,
             'extract_flat': 'in_playlist',
             'skip_download': True,
+            # Skip streaming manifests - only titles/ids are needed here
+            'extractor_args': {'youtube': {'skip': ['dash', 'hls', 'translated_subs']}},
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
         }
         
-        with YoutubeDL(ydl_opts) as ydl:
+        with self._pooled_ydl(ydl_opts) as ydl:
             info = ydl.extract_info(playlist_url, download=False)
         
         # Get the raw title from info
@@ -369,7 +736,8 @@ class YouTubePlaylistDownloader:
             title=sanitized_title,
             url=playlist_url,
             total_tracks=len(info.get('entries', [])),
-            entries=info.get('entries', [])
+            entries=info.get('entries', []),
+            raw_info=info
         )
     
     def pause(self) -> None:
@@ -383,7 +751,13 @@ class YouTubePlaylistDownloader:
     def _handle_pause(self, playlist_id: str, 
                      progress_callback: Optional[ProgressListener]) -> None:
         """Handle pause request"""
-        self.logger.info(f"Download paused for {playlist_id}")
+        self.logger.info("Download paused for %s", playlist_id)
+        
+        # Let merges already handed over finish before sitting idle
+        merge_pipeline = self._merge_pipelines.get(playlist_id)
+        if merge_pipeline:
+            merge_pipeline.join()
+        
         while self.pause_requested:
             if progress_callback:
                 progress = DownloadProgress(
@@ -395,9 +769,10 @@ class YouTubePlaylistDownloader:
                     current_file="",
                     message="Download paused"
                 )
-                progress_callback.on_progress(progress)
+                # Through the dispatcher, so older queued ticks can't land after it
+                self._emit_progress(progress_callback, progress, final=True)
             time.sleep(0.5)
-        self.logger.info(f"Resuming download for {playlist_id}")
+        self.logger.info("Resuming download for %s", playlist_id)
     
     def _create_playlist_folder(self, base_dir: str, playlist_title: str) -> str:
         """Create folder for playlist"""
@@ -405,7 +780,7 @@ class YouTubePlaylistDownloader:
         # Only sanitize the playlist_title which is a folder name
         sanitized_title = self.filename_sanitizer._sanitize_filename_component(playlist_title)
         folder_path = os.path.join(base_dir, sanitized_title)
-        os.makedirs(folder_path, exist_ok=True)
+        self._ensure_dir(folder_path)
         return folder_path
     
     def _create_marker_file(self, folder: str, playlist_id: str) -> None:
@@ -414,9 +789,27 @@ class YouTubePlaylistDownloader:
         with open(marker_path, 'w') as f:
             pass
     
+    def _submit_metadata(self, playlist_info: PlaylistInfo, folder_path: str, config: DownloadConfig) -> None:
+        """Generate the metadata files on the background pool"""
+        # A retry must not race with the previous attempt's writer
+        self._wait_for_metadata(playlist_info.id)
+        self._metadata_futures[playlist_info.id] = self._bg_pool.submit(
+            self._generate_playlist_metadata_file, playlist_info, folder_path, config
+        )
+    
+    def _wait_for_metadata(self, playlist_id: str) -> None:
+        """Wait for a pending metadata job, logging and ignoring errors"""
+        future = self._metadata_futures.pop(playlist_id, None)
+        if future is None:
+            return
+        try:
+            future.result(timeout=60)
+        except Exception as e:
+            self.logger.error("Error waiting for metadata files: %s", e)
+    
     def _generate_playlist_metadata_file(self, playlist_info: PlaylistInfo, folder_path: str, config: DownloadConfig) -> None:
         """Generate a metadata file with playlist details and artist information"""
-        self.logger.info(f"Generating metadata file for playlist: {playlist_info.title}")
+        self.logger.info("Generating metadata file for playlist: %s", playlist_info.title)
         
         try:
             # Get more detailed information if not already available
@@ -425,7 +818,11 @@ class YouTubePlaylistDownloader:
             # print(detailed_info)
             
             # If entries are empty or minimal, try to get more info
-            if not detailed_info.entries or len(detailed_info.entries) == 0:
+            if (not detailed_info.entries or len(detailed_info.entries) == 0) and detailed_info.raw_info:
+                # Reuse the info dict that was already extracted for this playlist
+                detailed_info.entries = detailed_info.raw_info.get('entries') or []
+                detailed_info.total_tracks = len(detailed_info.entries)
+            elif not detailed_info.entries or len(detailed_info.entries) == 0:
                 try:
                     # Try to get more detailed info but don't fail the whole download if it doesn't work
                     ydl_opts = {
@@ -433,14 +830,15 @@ class YouTubePlaylistDownloader:
                         'extract_flat': 'in_playlist',
                         'skip_download': True,
                     }
-                    with YoutubeDL(ydl_opts) as ydl:
+                    with self._pooled_ydl(ydl_opts) as ydl:
                         info = ydl.extract_info(detailed_info.url, download=False)
                         if info and 'entries' in info:
                             detailed_info.entries = info.get('entries', [])
                             # Update total tracks count
                             detailed_info.total_tracks = len(detailed_info.entries)
+                        detailed_info.raw_info = info
                 except Exception as e:
-                    self.logger.warning(f"Could not get detailed playlist info for metadata: {e}")
+                    self.logger.warning("Could not get detailed playlist info for metadata: %s", e)
             
             # Prepare metadata
             metadata = {
@@ -449,47 +847,40 @@ class YouTubePlaylistDownloader:
                 "playlist_url": detailed_info.url,
                 "total_tracks": detailed_info.total_tracks,
                 "extraction_date": datetime.now().isoformat(),
-                "videos": []
+                # Preallocated and filled by index below
+                "videos": [None] * len(detailed_info.entries)
             }
+            videos = metadata['videos']
             
             # Channel/uploader information (extracted from first video if available)
             channel_info = {}
             
             # Process entries for artist/uploader info and video details
             for i, entry in enumerate(detailed_info.entries):
+                vid = entry.get('id')
                 video_info = {
                     "position": i + 1,
                     "title": entry.get('title', 'Unknown Title'),
-                    "id": entry.get('id', 'Unknown ID'),
-                    "url": f"https://www.youtube.com/watch?v={entry.get('id')}" 
-                        if entry.get('id') else 'Unknown URL'
+                    "id": vid if vid is not None else 'Unknown ID',
+                    "url": f"https://www.youtube.com/watch?v={vid}" if vid else 'Unknown URL'
                 }
                 
-                # Extract uploader/channel info
-                if 'channel' in entry:
-                    video_info['channel'] = entry.get('channel', 'Unknown Channel')
-                if 'uploader' in entry:
-                    video_info['uploader'] = entry.get('uploader', 'Unknown Uploader')
-                if 'uploader_id' in entry:
-                    video_info['uploader_id'] = entry.get('uploader_id', 'Unknown Uploader ID')
-                if 'channel_id' in entry:
-                    video_info['channel_id'] = entry.get('channel_id', 'Unknown Channel ID')
-                if 'channel_url' in entry:
-                    video_info['channel_url'] = entry.get('channel_url', '')
+                # Extract uploader/channel info (one lookup per key)
+                for key in _OPTIONAL_VIDEO_FIELDS:
+                    if (value := entry.get(key)) is not None:
+                        video_info[key] = value
                 
                 # Get duration if available
-                if 'duration' in entry:
-                    duration = entry.get('duration')
-                    if duration:
-                        minutes, seconds = divmod(int(duration), 60)
-                        hours, minutes = divmod(minutes, 60)
-                        if hours > 0:
-                            video_info['duration'] = f"{hours}:{minutes:02d}:{seconds:02d}"
-                        else:
-                            video_info['duration'] = f"{minutes}:{seconds:02d}"
+                duration = entry.get('duration')
+                if duration:
+                    hours, rem = divmod(int(duration), 3600)
+                    minutes, seconds = divmod(rem, 60)
+                    video_info['duration'] = (
+                        f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+                    )
                 
                 # Add to videos list
-                metadata['videos'].append(video_info)
+                videos[i] = video_info
                 
                 # Capture channel info from first video if not already set
                 if not channel_info and i == 0:
@@ -500,50 +891,67 @@ class YouTubePlaylistDownloader:
                         'channel_url': video_info.get('channel_url', '')
                     }
             
+            # Fall back to playlist-level channel info already returned by yt-dlp
+            raw_info = detailed_info.raw_info
+            if not channel_info and raw_info:
+                channel_info = {
+                    'channel': raw_info.get('channel') or 'Unknown Channel',
+                    'uploader': raw_info.get('uploader') or 'Unknown Uploader',
+                    'channel_id': raw_info.get('channel_id') or '',
+                    'channel_url': raw_info.get('channel_url') or ''
+                }
+            
             # Add channel info to main metadata
             metadata.update(channel_info)
             
-            # Generate JSON metadata file
-            json_path = os.path.join(folder_path, "playlist_metadata.json")
-            with open(json_path, 'w', encoding='utf-8') as json_file:
-                json.dump(metadata, json_file, indent=2, ensure_ascii=False)
-            
-            # Generate CSV file for easy importing into other tools
-            csv_path = os.path.join(folder_path, "playlist_tracks.csv")
-            with open(csv_path, 'w', encoding='utf-8', newline='') as csv_file:
-                # Define CSV columns
-                fieldnames = ['position', 'title', 'id', 'url', 'channel', 'uploader', 'duration']
-                writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for video in metadata['videos']:
-                    # Create a row with only the fields we want in the CSV
-                    row = {field: video.get(field, '') for field in fieldnames if field in video}
-                    writer.writerow(row)
-            
-            # Create a simple README text file with basic info
-            readme_path = os.path.join(folder_path, "README.txt")
-            with open(readme_path, 'w', encoding='utf-8') as readme_file:
-                readme_file.write(f"Playlist: {detailed_info.title}\n")
-                readme_file.write(f"URL: {detailed_info.url}\n")
-                if 'channel' in channel_info:
-                    readme_file.write(f"Channel: {channel_info['channel']}\n")
-                if 'uploader' in channel_info:
-                    readme_file.write(f"Uploader: {channel_info['uploader']}\n")
-                if 'channel_url' in channel_info and channel_info['channel_url']:
-                    readme_file.write(f"Channel URL: {channel_info['channel_url']}\n")
-                readme_file.write(f"Total Tracks: {detailed_info.total_tracks}\n")
-                readme_file.write(f"Downloaded on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                readme_file.write("This folder contains:\n")
-                readme_file.write("- Video files downloaded from the playlist\n")
-                readme_file.write("- playlist_metadata.json: Complete playlist metadata in JSON format\n")
-                readme_file.write("- playlist_tracks.csv: Track listing in CSV format for importing\n")
-            
-            self.logger.info(f"Created metadata files in {folder_path}")
+            # Render all three files in memory so each is written with a single write call
+            payloads = {}
+            payloads["playlist_metadata.json"] = _dumps(metadata)
+            
+            # CSV file for easy importing into other tools
+            fieldnames = ['position', 'title', 'id', 'url', 'channel', 'uploader', 'duration']
+            csv_buffer = io.StringIO(newline='')
+            writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
+            writer.writeheader()
+            # Only keep the fields we want in the CSV
+            writer.writerows(
+                {field: video[field] for field in fieldnames if field in video}
+                for video in metadata['videos']
+            )
+            payloads["playlist_tracks.csv"] = csv_buffer.getvalue().encode('utf-8')
+            
+            # Simple README text file with basic info
+            readme_lines = [
+                f"Playlist: {detailed_info.title}",
+                f"URL: {detailed_info.url}"
+            ]
+            if 'channel' in channel_info:
+                readme_lines.append(f"Channel: {channel_info['channel']}")
+            if 'uploader' in channel_info:
+                readme_lines.append(f"Uploader: {channel_info['uploader']}")
+            if 'channel_url' in channel_info and channel_info['channel_url']:
+                readme_lines.append(f"Channel URL: {channel_info['channel_url']}")
+            readme_lines += [
+                f"Total Tracks: {detailed_info.total_tracks}",
+                f"Downloaded on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                "This folder contains:",
+                "- Video files downloaded from the playlist",
+                "- playlist_metadata.json: Complete playlist metadata in JSON format",
+                "- playlist_tracks.csv: Track listing in CSV format for importing",
+                ""
+            ]
+            payloads["README.txt"] = "\n".join(readme_lines).encode('utf-8')
+            
+            for name, payload in payloads.items():
+                with open(os.path.join(folder_path, name), 'wb') as f:
+                    f.write(payload)
+            
+            self.logger.info("Created metadata files in %s", folder_path)
             
         except Exception as e:
             # Don't fail the download if metadata generation fails
-            self.logger.error(f"Error generating metadata files: {e}")
+            self.logger.error("Error generating metadata files: %s", e)
         
     def _download_playlist(self, playlist_info: PlaylistInfo, 
                         folder: str, config: DownloadConfig,
@@ -551,44 +959,34 @@ class YouTubePlaylistDownloader:
         """Download the playlist with optimized options and generate metadata"""
         if progress_callback:
             progress_callback.on_download_start(playlist_info.id)
+            self._progress_template(playlist_info.id)
         
         # Ensure folder exists and all parent directories
-        os.makedirs(folder, exist_ok=True)
+        self._ensure_dir(folder)
         
-        # Generate metadata file before starting download
-        self._generate_playlist_metadata_file(playlist_info, folder, config)
+        # Generate metadata file in the background, overlapping with the download
+        self._submit_metadata(playlist_info, folder, config)
         
-        output_template = os.path.join(folder, config.output_template)
+        output_template = _join_template(folder, config.output_template)
 
-        # Verify template contains the folder path
-        if folder not in output_template:
-            self.logger.error(f"CRITICAL ERROR: Folder path missing from output template!")
-            self.logger.error(f"Folder: {folder}")
-            self.logger.error(f"Template: {output_template}")
+        # os.path.join only drops the folder when the template is absolute
+        if os.path.isabs(config.output_template):
+            self.logger.error("CRITICAL ERROR: Folder path missing from output template!")
+            self.logger.error("Folder: %s", folder)
+            self.logger.error("Template: %s", output_template)
             # Fix template directly
             output_template = os.path.normpath(folder + '/' + '%(playlist_index)02d-%(title)s.%(ext)s')
-            self.logger.info(f"Attempting to fix template: {output_template}")
+            self.logger.info("Attempting to fix template: %s", output_template)
 
         # Log what we're doing
-        self.logger.info(f"Using output template: {output_template}")
+        self.logger.info("Using output template: %s", output_template)
         
         # Prepare download options with improved settings
-        # Create a custom logger class that redirects yt-dlp output
-        outer_logger = self.logger  # Capture the logger from outer scope
-        
-        class QuietLogger:
-            def debug(self, msg):
-                pass  # Suppress debug messages
-            def warning(self, msg):
-                pass  # Suppress warnings
-            def error(self, msg):
-                outer_logger.error(f"yt-dlp error: {msg}")  # Use captured logger
-        
         ydl_opts = {
             'format': self.quality_formatter.get_format_string(
                 config.default_quality.value
             ),
-            'logger': QuietLogger(),  # Use custom logger to suppress output
+            'logger': self._ydl_logger,  # Suppresses output; shared so pooled instances match
             'noprogress': False,  # Keep progress hooks enabled
             'noplaylist': False,
             'outtmpl': output_template,
@@ -605,100 +1003,69 @@ class YouTubePlaylistDownloader:
         if config.use_postprocessing:
             ydl_opts['merge_output_format'] = config.preferred_format
         
+        # Pipeline merging: download the streams separately and merge them on a
+        # worker thread while yt-dlp moves on to the next item
+        merge_pipeline = None
+        primary_format, sep, fallback_formats = ydl_opts['format'].partition('/')
+        base_template = output_template[:-len('.%(ext)s')]
+        if (config.use_postprocessing and '+' in primary_format
+                and output_template.endswith('.%(ext)s') and shutil.which('ffmpeg')):
+            merge_pipeline = _MergePipeline(
+                self.logger,
+                config.preferred_format,
+                primary_format.count('+') + 1,
+                lambda: getattr(self, '_force_cancel', False),
+                self._tracked_pids
+            )
+            # "(video,audio)/fallback" - same choice as "video+audio/fallback", but each
+            # stream is downloaded as its own item; single-file fallbacks still work
+            ydl_opts['format'] = f"({primary_format.replace('+', ',')}){sep}{fallback_formats}"
+            ydl_opts['outtmpl'] = base_template + '.f%(format_id)s.%(ext)s'
+        
         # Add progress hook with throttling
         if progress_callback:
-            def progress_hook(d):
-                # Check for cancellation
-                if hasattr(self, '_force_cancel') and self._force_cancel:
-                    self.logger.debug("Progress hook detected cancellation")
-                    raise Exception("Download cancelled by user")
-                
-                status = d.get('status', '')
-                filename = d.get('filename', 'unknown file')
-                current_file = os.path.basename(filename) if filename else 'unknown'
-                
-                # Always process 'finished' and 'error' status immediately (no throttling)
-                if status == 'finished':
-                    try:
-                        progress_update = DownloadProgress(
-                            playlist_id=playlist_info.id,
-                            status=DownloadStatus.DOWNLOADING,
-                            progress=100,
-                            speed=0,
-                            eta=0,
-                            current_file=current_file,
-                            message=f"Processing: {current_file}"
-                        )
-                        progress_callback.on_progress(progress_update)
-                    except Exception as hook_error:
-                        self.logger.error(f"Error in progress hook (finished): {hook_error}")
-                    return
-                    
-                elif status == 'error':
-                    try:
-                        error_msg = d.get('error', 'Unknown error')
-                        progress_update = DownloadProgress(
-                            playlist_id=playlist_info.id,
-                            status=DownloadStatus.FAILED,
-                            progress=0,
-                            speed=0,
-                            eta=0,
-                            current_file="",
-                            message=f"Error: {error_msg}"
-                        )
-                        progress_callback.on_progress(progress_update)
-                    except Exception as hook_error:
-                        self.logger.error(f"Error in progress hook (error): {hook_error}")
-                    return
-                
-                # Throttle updates for 'downloading' status to avoid UI lag
-                if status == 'downloading':
-                    current_time = time.time()
-                    if (hasattr(self, '_last_progress_time') and 
-                        current_time - self._last_progress_time < 0.5):
-                        return
-                    
-                    self._last_progress_time = current_time
-                    
-                    try:
-                        self._handle_progress(d, playlist_info.id, progress_callback)
-                    except Exception as hook_error:
-                        self.logger.error(f"Error in progress hook (downloading): {hook_error}")
-                    
-            ydl_opts['progress_hooks'] = [progress_hook]
+            ydl_opts['progress_hooks'] = [partial(self._progress_hook, playlist_info.id, progress_callback)]
+        
+        if merge_pipeline:
+            ydl_opts.setdefault('progress_hooks', []).append(merge_pipeline.progress_hook)
         
         # Add cookies if configured
         if config.cookie_method != 'none':
             self._add_cookie_config(ydl_opts, config)
         
         # For debugging
-        self.logger.info(f"Download options: {ydl_opts}")
+        # repr of the nested options dict is costly - only build it when it will be logged
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Download options: %s", ydl_opts)
         
         # Download
-        with YoutubeDL(ydl_opts) as ydl:
+        merge_errors = []
+        with self._pooled_ydl(ydl_opts) as ydl:
+            if merge_pipeline:
+                # Items merged by an earlier attempt are skipped
+                ydl.params['match_filter'] = merge_pipeline.match_filter(ydl.prepare_filename, base_template)
+                self._merge_pipelines[playlist_info.id] = merge_pipeline
             try:
-                # For quick mode, skip info extraction
-                if getattr(config, 'quick_mode', False) or getattr(config, 'skip_metadata', False):
-                    # Go directly to download
-                    result = ydl.download([playlist_info.url])
-                else:
-                    # First try to extract info only to verify URL works
-                    try:
-                        self.logger.info(f"Extracting playlist info for {playlist_info.url}")
-                        ydl.extract_info(playlist_info.url, download=False)
-                    except Exception as info_error:
-                        self.logger.error(f"Info extraction error: {info_error}")
-                        # Continue anyway - sometimes the info extraction fails but download works
-                    
-                    # Proceed with download
-                    result = ydl.download([playlist_info.url])
-                
-                self.logger.info(f"Download result: {result}")
+                # download() performs the extraction itself - no separate pre-flight pass
+                result = ydl.download([playlist_info.url])
+                self.logger.info("Download result: %s", result)
                 
             except Exception as e:
                 error_msg = str(e)
-                self.logger.error(f"Download error: {error_msg}")
+                self.logger.error("Download error: %s", error_msg)
                 raise
+            finally:
+                # Wait for the last merges before reporting the playlist as done
+                if merge_pipeline:
+                    ydl.params.pop('match_filter', None)
+                    self._merge_pipelines.pop(playlist_info.id, None)
+                    merge_errors = merge_pipeline.close()
+                # Deliver pending progress before the caller reports completion/errors
+                self._flush_progress()
+        
+        # A failed merge fails the attempt, so download() retries or reports it
+        if merge_errors:
+            raise RuntimeError("; ".join(merge_errors))
 
     def _download_playlist_quick(self, playlist_info: PlaylistInfo,
                               folder: str, config: DownloadConfig,
@@ -706,29 +1073,19 @@ class YouTubePlaylistDownloader:
         """Optimized download implementation with minimal overhead"""
         if progress_callback:
             progress_callback.on_download_start(playlist_info.id)
+            self._progress_template(playlist_info.id)
         
         # Ensure folder exists
-        os.makedirs(folder, exist_ok=True)
+        self._ensure_dir(folder)
         
-        output_template = os.path.join(folder, config.output_template)
+        output_template = _join_template(folder, config.output_template)
         
         # Prepare download options with minimal settings
-        # Create a custom logger class that redirects yt-dlp output
-        outer_logger = self.logger  # Capture the logger from outer scope
-        
-        class QuietLogger:
-            def debug(self, msg):
-                pass
-            def warning(self, msg):
-                pass
-            def error(self, msg):
-                outer_logger.error(f"yt-dlp error: {msg}")  # Use captured logger
-        
         ydl_opts = {
             'format': self.quality_formatter.get_format_string(
                 config.default_quality.value
             ),
-            'logger': QuietLogger(),  # Use custom logger to suppress output
+            'logger': self._ydl_logger,  # Suppresses output; shared so pooled instances match
             'noprogress': False,  # Keep progress hooks enabled
             'noplaylist': False,
             'outtmpl': output_template,
@@ -741,48 +1098,7 @@ class YouTubePlaylistDownloader:
 
         # Add progress hook with throttling
         if progress_callback:
-            def progress_hook(d):
-                # Check for cancellation
-                if hasattr(self, '_force_cancel') and self._force_cancel:
-                    self.logger.debug("Progress hook detected cancellation")
-                    raise Exception("Download cancelled by user")
-                
-                status = d.get('status', '')
-                
-                # Always process 'finished' status immediately (no throttling)
-                if status == 'finished':
-                    try:
-                        filename = d.get('filename', 'unknown file')
-                        current_file = os.path.basename(filename) if filename else 'unknown'
-                        progress_update = DownloadProgress(
-                            playlist_id=playlist_info.id,
-                            status=DownloadStatus.DOWNLOADING,
-                            progress=100,
-                            speed=0,
-                            eta=0,
-                            current_file=current_file,
-                            message=f"Processing: {current_file}"
-                        )
-                        progress_callback.on_progress(progress_update)
-                    except Exception as hook_error:
-                        self.logger.error(f"Error in progress hook (finished): {hook_error}")
-                    return
-                
-                # Throttle updates for 'downloading' status to avoid UI lag
-                if status == 'downloading':
-                    current_time = time.time()
-                    if (hasattr(self, '_last_progress_time') and 
-                        current_time - self._last_progress_time < 0.5):
-                        return
-                    
-                    self._last_progress_time = current_time
-                    
-                    try:
-                        self._handle_progress(d, playlist_info.id, progress_callback)
-                    except Exception as hook_error:
-                        self.logger.error(f"Error in progress hook (downloading): {hook_error}")
-                    
-            ydl_opts['progress_hooks'] = [progress_hook]
+            ydl_opts['progress_hooks'] = [partial(self._progress_hook, playlist_info.id, progress_callback)]
         
         # Add cookies if configured, with minimal validation
         if config.cookie_method != 'none' and config.cookie_method == 'file':
@@ -793,14 +1109,80 @@ class YouTubePlaylistDownloader:
             ydl_opts['cookiesfrombrowser'] = (config.cookie_method, None, None, None)
         
         # Download
-        with YoutubeDL(ydl_opts) as ydl:
+        with self._pooled_ydl(ydl_opts) as ydl:
             try:
                 # Go directly to download, skip extraction step
                 result = ydl.download([playlist_info.url])
-                self.logger.info(f"Quick download result: {result}")
+                self.logger.info("Quick download result: %s", result)
             except Exception as e:
-                self.logger.error(f"Download error: {e}")
+                self.logger.error("Download error: %s", e)
                 raise
+            finally:
+                # Deliver pending progress before the caller reports completion/errors
+                self._flush_progress()
+    
+    def _progress_hook(self, playlist_id: str, callback: ProgressListener, d: Dict[str, Any]) -> None:
+        """yt-dlp progress hook; bound per playlist with functools.partial"""
+        # Check for cancellation
+        if hasattr(self, '_force_cancel') and self._force_cancel:
+            self.logger.debug("Progress hook detected cancellation")
+            raise Exception("Download cancelled by user")
+        
+        # Throttle 'downloading' ticks first, before any other work
+        status = d.get('status', '')
+        if status == 'downloading' and not self._should_emit_progress(d, playlist_id):
+            return
+        
+        # Always process 'finished' and 'error' status immediately (no throttling)
+        if status == 'finished':
+            try:
+                current_file = self._basename(d.get('filename'))
+                progress_update = replace(
+                    self._progress_template(playlist_id),
+                    progress=100,
+                    current_file=current_file,
+                    message=f"Processing: {current_file}"
+                )
+                self._emit_progress(callback, progress_update, final=True)
+            except Exception as hook_error:
+                self.logger.error("Error in progress hook (finished): %s", hook_error)
+            
+            # Pause at file boundaries only; mid-file the connection would time out
+            if self.pause_requested:
+                self._handle_pause(playlist_id, callback)
+            return
+        
+        elif status == 'error':
+            try:
+                error_msg = d.get('error', 'Unknown error')
+                progress_update = replace(
+                    self._progress_template(playlist_id),
+                    status=DownloadStatus.FAILED,
+                    message=f"Error: {error_msg}"
+                )
+                self._emit_progress(callback, progress_update, final=True)
+            except Exception as hook_error:
+                self.logger.error("Error in progress hook (error): %s", hook_error)
+            return
+        
+        # 'downloading' ticks that got past the throttle
+        if status == 'downloading':
+            try:
+                self._handle_progress(d, playlist_id, callback)
+            except Exception as hook_error:
+                self.logger.error("Error in progress hook (downloading): %s", hook_error)
+    
+    def _should_emit_progress(self, d: Dict[str, Any], playlist_id: str) -> bool:
+        """Let a 'downloading' tick through on a new whole percent or every 0.5s"""
+        get = d.get
+        total_bytes = get('total_bytes') or get('total_bytes_estimate') or 0
+        pct = int((get('downloaded_bytes') or 0) * 100 / total_bytes) if total_bytes > 0 else -1
+        now = time.monotonic()
+        last_time, last_pct = self._last_progress.get(playlist_id, (0.0, -1))
+        if pct == last_pct and now - last_time < 0.5:
+            return False
+        self._last_progress[playlist_id] = (now, pct)
+        return True
     
     def _handle_progress(self, d: Dict[str, Any], playlist_id: str,
                         callback: ProgressListener) -> None:
@@ -828,67 +1210,49 @@ class YouTubePlaylistDownloader:
                             progress = min(99.9, raw_progress)
                 
                 # Safely get filename
-                filename = "unknown.mp4"
-                if 'filename' in d:
-                    try:
-                        filename = os.path.basename(d.get('filename', ''))
-                    except:
-                        pass
+                filename = self._basename(d.get('filename'), "unknown.mp4")
                 
                 # Format speed safely
                 speed_val = int(speed) if speed else 0
                 eta_val = int(eta) if eta else 0
                 
-                progress_update = DownloadProgress(
-                    playlist_id=playlist_id,
-                    status=DownloadStatus.DOWNLOADING,
+                progress_update = replace(
+                    self._progress_template(playlist_id),
                     progress=progress,
                     speed=speed_val,
                     eta=eta_val,
                     current_file=filename,
                     message=f"Downloading: {filename}"
                 )
-                callback.on_progress(progress_update)
+                self._emit_progress(callback, progress_update)
             
             elif d['status'] == 'finished':
                 # Safely get filename
-                filename = "unknown.mp4"
-                if 'filename' in d:
-                    try:
-                        filename = os.path.basename(d.get('filename', ''))
-                    except:
-                        pass
+                filename = self._basename(d.get('filename'), "unknown.mp4")
                     
-                progress_update = DownloadProgress(
-                    playlist_id=playlist_id,
-                    status=DownloadStatus.DOWNLOADING,
+                progress_update = replace(
+                    self._progress_template(playlist_id),
                     progress=100,
-                    speed=0,
-                    eta=0,
                     current_file=filename,
                     message=f"Processing: {filename}"
                 )
-                callback.on_progress(progress_update)
+                self._emit_progress(callback, progress_update, final=True)
                 
             # Handle error status
             elif d['status'] == 'error':
                 error_msg = d.get('error', 'Unknown error')
-                self.logger.error(f"Download error in progress hook: {error_msg}")
+                self.logger.error("Download error in progress hook: %s", error_msg)
                 
-                progress_update = DownloadProgress(
-                    playlist_id=playlist_id,
+                progress_update = replace(
+                    self._progress_template(playlist_id),
                     status=DownloadStatus.FAILED,
-                    progress=0,
-                    speed=0,
-                    eta=0,
-                    current_file="",
                     message=f"Error: {error_msg}"
                 )
-                callback.on_progress(progress_update)
+                self._emit_progress(callback, progress_update, final=True)
         
         except Exception as e:
             # Log the error but don't crash
-            self.logger.error(f"Error in progress handler: {e}")
+            self.logger.error("Error in progress handler: %s", e)
     
     def _add_cookie_config(self, ydl_opts: Dict, config: DownloadConfig) -> None:
         """Add cookie configuration to yt-dlp options"""
@@ -896,13 +1260,13 @@ class YouTubePlaylistDownloader:
             if config.cookie_file and os.path.exists(config.cookie_file):
                 # Use 'cookiefile' parameter - this is correct for the Python API!
                 ydl_opts['cookiefile'] = config.cookie_file
-                self.logger.info(f"Using cookie file: {config.cookie_file}")
+                self.logger.info("Using cookie file: %s", config.cookie_file)
             else:
-                self.logger.warning(f"Cookie file not found or not set: {config.cookie_file}")
+                self.logger.warning("Cookie file not found or not set: %s", config.cookie_file)
         elif config.cookie_method != 'none':
             # For browser cookies
             ydl_opts['cookiesfrombrowser'] = (config.cookie_method, None, None, None)
-            self.logger.info(f"Using cookies from browser: {config.cookie_method}")
+            self.logger.info("Using cookies from browser: %s", config.cookie_method)
             
         # Add additional yt-dlp options that help with bot detection
         ydl_opts.update({
@@ -21,6 +21,10 @@ class HistoryRepository(Protocol):
         """Save a history entry"""
         ...
     
+    def save_entries(self, entries: List[HistoryEntry]) -> None:
+        """Save several history entries at once"""
+        ...
+    
     def load_history(self) -> List[HistoryEntry]:
         """Load all history entries"""
         ...
@@ -70,6 +74,8 @@ class PlaylistDownloader(Protocol):
 class ProgressListener(Protocol):
     """Interface for progress updates"""
     
+    __slots__ = ()  # Lets implementations such as DownloadPresenter use __slots__
+    
     def on_progress(self, progress: DownloadProgress) -> None:
         """Called when download progress updates"""
         ...
@@ -1,94 +1,173 @@
 import os
+import mmap
 import logging
-import time
+import threading
 from typing import List, Optional
 import re
+from collections import OrderedDict
+from types import MappingProxyType
 from src.utils.logging_utils import get_logger
 
 # Get module logger
 logger = get_logger(__name__)
 
+_SEP = os.sep
+_IS_POSIX = _SEP == '/'
+
+# yt-dlp format strings for the predefined qualities; flexible so they don't
+# require specific codecs
+_FORMAT_STRINGS = MappingProxyType({
+    'best': 'bestvideo+bestaudio/best',
+    '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]/best',
+    '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]/best',
+    '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]/best',
+    'audio_only': 'bestaudio/best'
+})
+_RESOLUTION_RE = re.compile(r'(\d+)p')
+_COMMON_HEIGHTS = (144, 240, 360, 480, 720, 1080, 1440, 2160)
+
+
+def _resolution_format(height) -> str:
+    """Format string for the best video up to the given height plus best audio"""
+    return f'bestvideo[height<={height}]+bestaudio/best[height<={height}]/best'
+
+
+# Characters replaced in filename components (path separators are kept)
+_INVALID_TRANS = str.maketrans({c: '_' for c in '\\*?:"<>|'})
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class OptimizedYouTubeCookieValidator:
     """Optimized validator with caching for YouTube cookies"""
     
+    __slots__ = ('logger', '_local', 'required_cookies', '_validation_cache', '_dispatch')
+    
     def __init__(self):
         # Get class-specific logger
         self.logger = get_logger(f"{__name__}.YouTubeCookieValidator")
-        self.errors: List[str] = []
+        
+        # Errors are kept per thread: the validator is shared by the settings dialog,
+        # the download service and the download workers, and validate() followed by
+        # get_validation_errors() must see its own result
+        self._local = threading.local()
         self.required_cookies = {"SID", "HSID", "SAPISID"}
         
         # Add cache for validation results
-        self._validation_cache = {}  # {(method, file_path): (is_valid, timestamp)}
-        self._cache_ttl = 3600  # Cache TTL in seconds (1 hour)
+        # {file_path: (is_valid, file signature)} - an entry stays valid until
+        # the cookie file's signature changes
+        self._validation_cache = {}
+        
+        # Handlers per cookie method; any other method is treated as a browser
+        self._dispatch = MappingProxyType({
+            'none': self._validate_none,
+            'file': self._validate_file,
+        })
         
         self.logger.debug("Optimized YouTube cookie validator initialized")
     
+    @property
+    def errors(self) -> List[str]:
+        """Errors from the calling thread's last validate()"""
+        try:
+            return self._local.errors
+        except AttributeError:
+            errors = self._local.errors = []
+            return errors
+    
     def validate(self, method: str, file_path: Optional[str] = None, 
                 skip_for_quick_mode: bool = False) -> bool:
         """Validate cookies with caching and quick mode option"""
         self.errors.clear()
         
         if skip_for_quick_mode:
-            self.logger.debug("Skipping validation for quick mode")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Skipping validation for quick mode")
             return True
         
-        if method == 'none':
+        # Anything other than 'none' or 'file' is a browser name
+        handler = self._dispatch.get(method, self._validate_browser)
+        return handler(method, file_path)
+    
+    def _validate_none(self, method: str, file_path: Optional[str]) -> bool:
+        """No cookies used, nothing to validate"""
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Cookie method 'none' selected, no validation needed")
-            return True
-        
-        # Check cache first
-        cache_key = (method, file_path)
-        if cache_key in self._validation_cache:
-            is_valid, timestamp = self._validation_cache[cache_key]
-            
-            # Check if cache is still valid
-            if time.time() - timestamp < self._cache_ttl:
-                self.logger.debug(f"Using cached validation result for {method}: {is_valid}")
-                return is_valid
-                
-            # Cache expired, remove it
-            del self._validation_cache[cache_key]
-        
-        # For browser methods, we assume they're valid if the browser exists
-        if method != 'file':
-            self.logger.debug(f"Using browser cookie method: {method}, assuming valid")
-            self._validation_cache[cache_key] = (True, time.time())
-            return True
-        
-        # Validate file method
+        return True
+    
+    def _validate_browser(self, method: str, file_path: Optional[str]) -> bool:
+        """Browser methods are assumed valid if the browser exists"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Using browser cookie method: %s, assuming valid", method)
+        return True
+    
+    def _validate_file(self, method: str, file_path: Optional[str]) -> bool:
+        """Validate a cookie file, reusing the cached result while the file is unchanged"""
         if not file_path:
             self.errors.append("Cookie file path not provided")
             self.logger.warning("Cookie file path not provided")
-            self._validation_cache[cache_key] = (False, time.time())
             return False
+        
+        st = self._stat(file_path)
+        if st is None:
+            # Nothing to cache against; report it without stat'ing again
+            self.errors.append(f"Cookie file not found: {file_path}")
+            self.logger.warning("Cookie file not found: %s", file_path)
+            return False
+        
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._validation_cache.get(file_path)
+        if cached is not None:
+            is_valid, cached_signature = cached
             
-        result = self._validate_cookie_file(file_path)
+            # Still valid as long as the cookie file hasn't changed
+            if cached_signature == signature:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Using cached validation result for %s: %s", file_path, is_valid)
+                return is_valid
+        
+        result = self._validate_cookie_file(file_path, st)
         
-        # Cache the result
-        self._validation_cache[cache_key] = (result, time.time())
+        # Cache the result against the file state it was computed from
+        self._validation_cache[file_path] = (result, signature)
         return result
     
-    def _validate_cookie_file(self, file_path: str) -> bool:
+    @staticmethod
+    def _stat(file_path: Optional[str]) -> Optional[os.stat_result]:
+        """stat a file, or None if it can't be stat'ed"""
+        if not file_path:
+            return None
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+    
+    def _validate_cookie_file(self, file_path: str, st: Optional[os.stat_result] = None) -> bool:
         """Validate cookie file with minimal checks"""
-        self.logger.debug(f"Validating cookie file: {file_path}")
-        
-        if not os.path.exists(file_path):
-            self.errors.append(f"Cookie file not found: {file_path}")
-            self.logger.warning(f"Cookie file not found: {file_path}")
-            return False
+        self.logger.debug("Validating cookie file: %s", file_path)
+        
+        # One stat gives both existence and size
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                self.errors.append(f"Cookie file not found: {file_path}")
+                self.logger.warning("Cookie file not found: %s", file_path)
+                return False
         
-        if os.path.getsize(file_path) == 0:
+        if st.st_size == 0:
             self.errors.append("Cookie file is empty")
             self.logger.warning("Cookie file is empty")
             return False
         
         # Simplified validation - just check if the file contains youtube.com
         try:
-            # Read first few KB to check for YouTube cookies
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                sample = f.read(4096)  # Read first 4KB
+            # Read first few KB as raw bytes - the check is ASCII, no decoding needed
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                sample = os.read(fd, 4096)  # Read first 4KB
+            finally:
+                os.close(fd)
                 
-            if 'youtube.com' not in sample:
+            if b'youtube.com' not in sample:
                 self.errors.append("Cookie file does not appear to contain YouTube cookies")
                 self.logger.warning("Cookie file doesn't contain YouTube cookies")
                 return False
@@ -98,19 +177,21 @@ class OptimizedYouTubeCookieValidator:
             
         except Exception as e:
             self.errors.append(f"Could not read cookie file: {e}")
-            self.logger.error(f"Could not read cookie file: {e}")
+            self.logger.error("Could not read cookie file: %s", e)
             return False
             
     def get_validation_errors(self) -> List[str]:
         """Get validation error messages"""
         if self.errors:
-            self.logger.debug(f"Returning {len(self.errors)} validation errors")
+            self.logger.debug("Returning %s validation errors", len(self.errors))
         return self.errors.copy()
 
 
 class YouTubeCookieValidator:
     """Validates YouTube cookies for authentication"""
     
+    __slots__ = ('logger', 'errors', 'required_cookies')
+    
     def __init__(self):
         # Get class-specific logger
         self.logger = get_logger(f"{__name__}.YouTubeCookieValidator")
@@ -149,54 +230,56 @@ class YouTubeCookieValidator:
             return self._validate_cookie_file(file_path)
         
         # For browser methods, we assume they're valid if the browser exists
-        self.logger.debug(f"Using browser cookie method: {method}, assuming valid")
+        self.logger.debug("Using browser cookie method: %s, assuming valid", method)
         return True
     
     def get_validation_errors(self) -> List[str]:
         """Get validation error messages"""
         if self.errors:
-            self.logger.debug(f"Returning {len(self.errors)} validation errors")
+            self.logger.debug("Returning %s validation errors", len(self.errors))
         return self.errors.copy()
     
-    def _validate_cookie_file(self, file_path: str) -> bool:
+    def _validate_cookie_file(self, file_path: str, st: Optional[os.stat_result] = None) -> bool:
         """Validate cookie file contents"""
-        self.logger.debug(f"Validating cookie file: {file_path}")
-        
-        if not os.path.exists(file_path):
-            self.errors.append(f"Cookie file not found: {file_path}")
-            self.logger.warning(f"Cookie file not found: {file_path}")
-            return False
+        self.logger.debug("Validating cookie file: %s", file_path)
+        
+        # One stat gives both existence and size
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                self.errors.append(f"Cookie file not found: {file_path}")
+                self.logger.warning("Cookie file not found: %s", file_path)
+                return False
         
-        if os.path.getsize(file_path) == 0:
+        if st.st_size == 0:
             self.errors.append("Cookie file is empty")
             self.logger.warning("Cookie file is empty")
             return False
         
+        # Map the file and let C-level substring searches do the scanning
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            self.logger.debug(f"Successfully read cookie file with {len(lines)} lines")
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"youtube.com") < 0:
+                    has_youtube = False
+                    present = set()
+                else:
+                    has_youtube = True
+                    present = {
+                        name for name in self.required_cookies
+                        if self._has_youtube_cookie(mm, name)
+                    }
         except Exception as e:
             self.errors.append(f"Could not read cookie file: {e}")
-            self.logger.error(f"Could not read cookie file: {e}")
+            self.logger.error("Could not read cookie file: %s", e)
             return False
         
-        youtube_cookies = [line for line in lines if "youtube.com" in line]
-        if not youtube_cookies:
+        if not has_youtube:
             self.errors.append("Cookie file does not contain YouTube cookies")
             self.logger.warning("Cookie file does not contain YouTube cookies")
             return False
         
-        self.logger.debug(f"Found {len(youtube_cookies)} YouTube cookies")
-        
-        # Check for required cookies
-        present = set()
-        for line in youtube_cookies:
-            parts = line.strip().split('\t')
-            if len(parts) >= 7:
-                name = parts[5]
-                present.add(name)
-        
         missing = self.required_cookies - present
         if missing:
             error_msg = f"Missing required cookies: {', '.join(missing)}"
@@ -206,17 +289,38 @@ class YouTubeCookieValidator:
         
         self.logger.debug("Cookie validation successful")
         return True
+    
+    @staticmethod
+    def _has_youtube_cookie(mm: mmap.mmap, name: str) -> bool:
+        """Check for a Netscape-format youtube.com cookie line with the given name"""
+        needle = b"\t" + name.encode('ascii') + b"\t"
+        pos = mm.find(needle)
+        while pos >= 0:
+            line_start = mm.rfind(b"\n", 0, pos) + 1
+            line_end = mm.find(b"\n", pos)
+            if line_end < 0:
+                line_end = len(mm)
+            # Name must be the 6th field on a youtube.com line - the needle's own
+            # leading tab is the 5th separator, so 4 more come before it
+            if (mm[line_start:pos].count(b"\t") == 4
+                    and mm.find(b"youtube.com", line_start, line_end) >= 0):
+                return True
+            pos = mm.find(needle, pos + 1)
+        return False
 
 
 class FileNameSanitizer:
     """Sanitizes filenames for filesystem safety"""
     
+    __slots__ = ('logger', '_sanitize_cache', '_cache_lock', '_cache_size_limit')
+    
     def __init__(self):
         # Get class-specific logger
         self.logger = get_logger(f"{__name__}.FileNameSanitizer")
         
         # Cache to avoid sanitizing same strings repeatedly
-        self._sanitize_cache = {}
+        self._sanitize_cache: OrderedDict = OrderedDict()  # LRU order, oldest first
+        self._cache_lock = threading.Lock()  # Shared by concurrent download workers
         self._cache_size_limit = 1000  # Limit cache size to prevent memory issues
         
         self.logger.debug("Filename sanitizer initialized with caching")
@@ -224,71 +328,44 @@ class FileNameSanitizer:
     def sanitize(self, filename: str) -> str:
         """Sanitize a filename (not a path) for filesystem safety"""
         # Check if this is in cache
-        if filename in self._sanitize_cache:
-            return self._sanitize_cache[filename]
+        with self._cache_lock:
+            cached = self._sanitize_cache.get(filename)
+            if cached is not None:
+                self._sanitize_cache.move_to_end(filename)
+                return cached
             
-        # Check if this is a path - if so, handle differently
-        if os.path.sep in filename:
-            self.logger.debug(f"Sanitizing path: {filename}")
-            # This is likely a path, not just a filename
-            # Split path into components and sanitize each filename component
-            # while preserving the path structure
-            path_parts = filename.split(os.path.sep)
-            sanitized_parts = []
+        sanitize_component = self._sanitize_filename_component
+        if _SEP not in filename:
+            # Common case: a plain filename
+            result = sanitize_component(filename)
+        else:
+            # Empty parts from repeated separators are dropped
+            parts = filename.split(_SEP)
+            sanitized_parts = [sanitize_component(part) for part in parts if part]
             
-            # Process each part of the path, preserving empty parts for absolute paths
-            for i, part in enumerate(path_parts):
-                # Skip empty parts at the beginning (for absolute paths)
-                if i == 0 and not part and os.path.sep == '/':
-                    sanitized_parts.append('')
-                    continue
-                    
-                # Skip empty parts that might result from consecutive separators
-                if not part:
-                    continue
-                    
-                # Sanitize the part if it's not empty
-                sanitized_part = self._sanitize_filename_component(part)
-                sanitized_parts.append(sanitized_part)
-                
-            # Rejoin the path with appropriate separators
-            result = os.path.sep.join(sanitized_parts)
+            # Preserve the leading empty part of an absolute POSIX path
+            if not parts[0] and _IS_POSIX:
+                sanitized_parts.insert(0, '')
             
-            # Prune cache if needed
-            if len(self._sanitize_cache) >= self._cache_size_limit:
-                # Use a simple LRU-like strategy - clear half the cache
-                keys_to_remove = list(self._sanitize_cache.keys())[:self._cache_size_limit // 2]
-                for key in keys_to_remove:
-                    del self._sanitize_cache[key]
-                    
-            # Cache the result
+            result = _SEP.join(sanitized_parts)
+        
+        # Cache the result, evicting the least recently used entry when full
+        with self._cache_lock:
             self._sanitize_cache[filename] = result
-            
-            self.logger.debug(f"Sanitized path result: {result}")
-            return result
-        else:
-            # This is just a filename, sanitize directly
-            self.logger.debug(f"Sanitizing filename: {filename}")
-            result = self._sanitize_filename_component(filename)
-            
-            # Cache the result
-            if len(self._sanitize_cache) < self._cache_size_limit:
-                self._sanitize_cache[filename] = result
-                
-            self.logger.debug(f"Sanitized filename result: {result}")
-            return result
+            if len(self._sanitize_cache) > self._cache_size_limit:
+                self._sanitize_cache.popitem(last=False)
+        return result
             
     def _sanitize_filename_component(self, component: str) -> str:
         """Sanitize a single filename component (not a path)"""
-        # Remove invalid characters, but NOT path separators
-        invalid_chars = r'\\*?:"<>|'  # Note: removed / from the invalid chars list
-        sanitized = re.sub(f'[{re.escape(invalid_chars)}]', "_", component)
+        # Replace invalid characters, but NOT path separators
+        sanitized = component.translate(_INVALID_TRANS)
         
         # Remove leading/trailing whitespace and dots
         sanitized = sanitized.strip('. ')
         
         # Replace multiple spaces with single space
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = _WHITESPACE_RE.sub(' ', sanitized)
         
         # Limit length
         if len(sanitized) > 200:
@@ -306,46 +383,37 @@ class FileNameSanitizer:
 class QualityFormatter:
     """Generates yt-dlp format strings for different qualities"""
     
+    __slots__ = ('logger', 'format_strings', '_formats')
+    
     def __init__(self):
         # Get class-specific logger
         self.logger = get_logger(f"{__name__}.QualityFormatter")
         
-        self.format_strings = {
-            # More flexible format strings that don't require specific codecs
-            'best': 'bestvideo+bestaudio/best',
-            '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]/best',
-            '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]/best',
-            '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]/best',
-            'audio_only': 'bestaudio/best'
-        }
+        # Shared read-only table of predefined formats
+        self.format_strings = _FORMAT_STRINGS
         
-        # Cache for custom format strings
-        self._custom_format_cache = {}
+        # Single lookup table: predefined formats, common resolutions pre-generated,
+        # and custom formats added as they are first requested
+        self._formats = dict(_FORMAT_STRINGS)
+        for height in _COMMON_HEIGHTS:
+            self._formats.setdefault(f'{height}p', _resolution_format(height))
         
         self.logger.debug("Quality formatter initialized with format cache")
     
     def get_format_string(self, quality: str) -> str:
         """Get yt-dlp format string for given quality"""
-        # Check if quality has a predefined format
-        if quality in self.format_strings:
-            return self.format_strings[quality]
-            
-        # Check if we have a cached custom format
-        if quality in self._custom_format_cache:
-            return self._custom_format_cache[quality]
+        try:
+            return self._formats[quality]
+        except KeyError:
+            pass
             
-        # Generate custom format string
-        # Basic pattern: match resolution and get best audio
-        custom_format = None
-        
         # Try to interpret quality as a resolution
-        resolution_match = re.match(r'(\d+)p', quality)
+        resolution_match = _RESOLUTION_RE.match(quality)
         if resolution_match:
-            height = resolution_match.group(1)
-            custom_format = f'bestvideo[height<={height}]+bestaudio/best[height<={height}]/best'
-            self._custom_format_cache[quality] = custom_format
+            custom_format = _resolution_format(resolution_match.group(1))
+            self._formats[quality] = custom_format
             return custom_format
             
         # Fallback to best if no match
-        self.logger.warning(f"Unknown quality '{quality}', using 'best' instead")
-        return self.format_strings['best']
\ No newline at end of file
+        self.logger.warning("Unknown quality '%s', using 'best' instead", quality)
+        return _FORMAT_STRINGS['best']
\ No newline at end of file
@@ -2,6 +2,8 @@
 
 import json
 import os
+from dataclasses import replace
+from typing import Optional
 from src.data.models import DownloadConfig, DownloadQuality
 from src.core.interfaces import ConfigurationRepository
 from src.utils.environment import env
@@ -11,6 +13,10 @@ class EnvironmentConfigRepository(ConfigurationRepository):
     
     def __init__(self, config_file: str = "downloader_config.json"):
         self.config_file = config_file
+        
+        # Last config parsed from the file, reused until the file's mtime changes
+        self._file_config: Optional[DownloadConfig] = None
+        self._file_mtime: Optional[int] = None
     
     def load_config(self) -> DownloadConfig:
         """Load configuration from src.utils.environment variables with fallback to file"""
@@ -75,15 +81,23 @@ class EnvironmentConfigRepository(ConfigurationRepository):
         
         with open(self.config_file, 'w') as f:
             json.dump(data, f, indent=2)
+        
+        # The file changed - parse it again on the next load
+        self._file_config = None
     
     def _load_from_file(self) -> DownloadConfig:
         """Load configuration from file as fallback"""
-        default_config = DownloadConfig()
-        
-        if not os.path.exists(self.config_file):
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            default_config = DownloadConfig()
             self.save_config(default_config)
             return default_config
         
+        # Unchanged since the last parse - only a stat needed
+        if self._file_config is not None and mtime == self._file_mtime:
+            return replace(self._file_config)
+        
         try:
             with open(self.config_file, 'r') as f:
                 data = json.load(f)
@@ -92,6 +106,9 @@ class EnvironmentConfigRepository(ConfigurationRepository):
                 if 'default_quality' in data:
                     data['default_quality'] = DownloadQuality(data['default_quality'])
                     
-                return DownloadConfig(**data)
+                file_config = DownloadConfig(**data)
         except Exception:
-            return default_config
\ No newline at end of file
+            return DownloadConfig()
+        
+        self._file_config, self._file_mtime = file_config, mtime
+        return replace(file_config)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -56,29 +56,7 @@ class DownloadConfig:
     
     def copy(self):
         """Create a copy of the config"""
-        return DownloadConfig(
-            download_directory=self.download_directory,
-            max_concurrent_downloads=self.max_concurrent_downloads,
-            default_quality=self.default_quality,
-            retry_count=self.retry_count,
-            auto_retry_failed=self.auto_retry_failed,
-            check_duplicates=self.check_duplicates,
-            bandwidth_limit=self.bandwidth_limit,
-            cookie_method=self.cookie_method,
-            cookie_file=self.cookie_file,
-            output_template=self.output_template,
-            create_playlist_folder=self.create_playlist_folder,
-            sanitize_filenames=self.sanitize_filenames,
-            preferred_format=self.preferred_format,
-            use_postprocessing=self.use_postprocessing,
-            quick_mode=self.quick_mode,
-            skip_validation=self.skip_validation,
-            skip_metadata=self.skip_metadata,
-            throttle_progress=self.throttle_progress,
-            cache_lifetime=self.cache_lifetime,
-            use_memory_cache=self.use_memory_cache,
-            parallel_downloads=self.parallel_downloads
-        )
+        return replace(self)
 
 
 @dataclass
@@ -88,10 +66,14 @@ class PlaylistInfo:
     url: str
     total_tracks: int
     entries: list
+    raw_info: Optional[Dict[str, Any]] = field(default=None, repr=False)  # Info dict from yt-dlp, if fetched
 
 
 @dataclass
 class DownloadProgress:
+    # Created on every progress tick - slots avoid a per-instance __dict__
+    __slots__ = ('playlist_id', 'status', 'progress', 'speed', 'eta', 'current_file', 'message')
+    
     playlist_id: str
     status: DownloadStatus
     progress: float
@@ -108,6 +90,16 @@ class HistoryEntry:
     status: str
     timestamp: datetime
     download_path: str
+    
+    def to_cache_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict of this entry, as stored in the history file"""
+        return {
+            'playlist_id': self.playlist_id,
+            'playlist_title': self.playlist_title,
+            'status': self.status,
+            'timestamp': self.timestamp.isoformat(),
+            'download_path': self.download_path
+        }
 
 
 @dataclass
@@ -1,20 +1,185 @@
+import atexit
+import itertools
 import json
+import mmap
 import os
-import shutil
+import threading
 import time
-from typing import List, Optional, Dict, Any, Union, Set
+import warnings
+from collections import OrderedDict
+from dataclasses import fields, replace
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Union, Set, Tuple
 from datetime import datetime
 from src.data.models import DownloadConfig, HistoryEntry, DownloadQuality
 
+# Use orjson for (de)serialization if installed, with stdlib fallback.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _dumps_compact = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    
+    # One encoder for every save; non-ASCII titles are written as-is rather than escaped
+    _encode = json.JSONEncoder(indent=2, ensure_ascii=False, separators=(',', ': ')).encode
+    
+    def _dumps(obj: Any) -> bytes:
+        return _encode(obj).encode('utf-8')
+    
+    _encode_compact = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    
+    def _dumps_compact(obj: Any) -> bytes:
+        return _encode_compact(obj).encode('utf-8')
+    
+    _loads = json.loads
+
+# History files above this size are parsed straight from a memory map
+_MMAP_THRESHOLD = 256 * 1024
+
+# DownloadConfig fields, in the order they are written to the config file
+_CONFIG_FIELDS = tuple(f.name for f in fields(DownloadConfig))
+_QUALITY_BY_VALUE = {quality.value: quality for quality in DownloadQuality}
+
+# Seconds to wait after a save before writing, so bursts of saves share one write
+_FLUSH_DELAY = 0.75
+
+# An append-only history log is compacted once it grows past twice its last compacted
+# size plus this slack
+_COMPACT_SLACK = 64 * 1024
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write to a temp file and swap it in, so a crash never leaves a truncated file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _load_history_file(path: str) -> List[Dict[str, Any]]:
+    """Parse a history file, treating an empty file or an empty list as no entries"""
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            # orjson parses the mapped pages directly, skipping the copy into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+        content = f.read().strip()
+    
+    # Nothing to parse for an empty file or an empty list
+    if content in (b"", b"[]"):
+        return []
+    return _loads(content)
+
+
+def _load_history_log(path: str) -> Tuple[List[Dict[str, Any]], bool, int]:
+    """Parse a newline-delimited history log, oldest record first.
+    
+    Also reads the older single-array format. The flag is True when the file should be
+    rewritten as a clean log (array format, or a torn or unreadable line); the count is
+    the number of unreadable lines skipped.
+    """
+    entries = []
+    needs_rewrite = False
+    skipped = 0
+    with open(path, 'rb') as f:
+        # Stream the log a line at a time rather than reading it whole
+        for line in f:
+            torn = not line.endswith(b'\n')  # Interrupted append
+            line = line.strip()
+            if not line:
+                continue
+            if not entries and not needs_rewrite and line.startswith(b'['):
+                break  # Old array format, which can span lines
+            needs_rewrite |= torn
+            try:
+                entries.append(_loads(line))
+            except json.JSONDecodeError:
+                skipped += 1
+                needs_rewrite = True
+        else:
+            return entries, needs_rewrite, skipped
+    
+    return _load_history_file(path), True, 0
+
+
+@lru_cache(maxsize=16384)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since the same history is converted repeatedly"""
+    return datetime.fromisoformat(value)
+
+
+def _entry_from_dict(item: Dict[str, Any]) -> Optional[HistoryEntry]:
+    """Build a HistoryEntry from a stored dict, or None if the dict is invalid"""
+    try:
+        # Convert timestamp string to datetime
+        if isinstance(item.get('timestamp'), str):
+            timestamp = _parse_timestamp(item['timestamp'])
+        else:
+            timestamp = datetime.now()  # Fallback
+        
+        return HistoryEntry(
+            playlist_id=item['playlist_id'],
+            playlist_title=item['playlist_title'],
+            status=item['status'],
+            timestamp=timestamp,
+            download_path=item['download_path']
+        )
+    except Exception as e:
+        print(f"Error converting history entry: {e}")
+        return None
+
+
+def _entry_to_dict(entry: Union[HistoryEntry, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a history entry to a JSON-serializable dict"""
+    if isinstance(entry, HistoryEntry):
+        return entry.to_cache_dict()
+    
+    # Already a dict, make sure timestamp is a string
+    entry_dict = dict(entry)  # Make a copy to avoid modifying the original
+    if 'timestamp' in entry_dict and hasattr(entry_dict['timestamp'], 'isoformat'):
+        entry_dict['timestamp'] = entry_dict['timestamp'].isoformat()
+    return entry_dict
+
+
 class OptimizedJsonHistoryRepository:
-    """Optimized JSON file-based history storage with memory caching"""
+    """Optimized history storage with memory caching, kept as an append-only JSON lines log.
     
-    def __init__(self, history_file: str = "download_history.json"):
+    Each save appends one record per entry; on load the log is replayed with the last
+    record for a playlist ID winning, and it is compacted once it has grown enough.
+    Only the max_cache most recently used entries are kept in memory; the rest are
+    read back from the log when needed.
+    """
+    
+    def __init__(self, history_file: str = "download_history.json", max_cache: int = 10000):
         self.history_file = history_file
-        self.cache = {}  # In-memory cache
-        self.completed_ids = set()  # Fast lookup for duplicates
+        self.max_cache = max_cache
+        self.cache: OrderedDict = OrderedDict()  # In-memory LRU cache, oldest first
+        self.completed_ids = set()  # Fast lookup for duplicates - covers evicted entries too
+        self._evicted = False  # Some entries live only on disk
         self._loaded = False  # Flag to track if we've loaded from file
         
+        # Saves only update the cache and queue the record; a background writer thread
+        # appends them after a short debounce, so callers never wait on disk I/O
+        self._lock = threading.Lock()  # Guards cache, completed_ids and flush state
+        self._flush_lock = threading.Lock()  # Serializes file writes so they land in order
+        self._pending: List[Dict[str, Any]] = []  # Records not yet appended to the log
+        self._needs_compact = False  # Whole log must be rewritten on the next flush
+        self._last_compact_size = 0  # Log size right after it was last loaded or compacted
+        self._wake_writer = threading.Event()
+        self._writer = threading.Thread(target=self._writer_loop, name="HistoryWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)  # The writer is a daemon; write whatever is left on exit
+        
     def _ensure_loaded(self):
         """Ensure history is loaded into memory"""
         if not self._loaded:
@@ -23,28 +188,35 @@ class OptimizedJsonHistoryRepository:
             
     def _load_cache(self):
         """Load history into memory cache"""
+        # Drop a temp file left behind by a write that was interrupted before the swap
+        try:
+            os.remove(self.history_file + ".tmp")
+        except OSError:
+            pass
+        
+        # A missing file is just empty history; it gets created on the first save
         if not os.path.exists(self.history_file):
-            # Create an empty history file if it doesn't exist
-            with open(self.history_file, 'w') as f:
-                json.dump([], f)
             return
         
         try:
-            with open(self.history_file, 'r') as f:
-                content = f.read().strip()
-                # Check if file is empty or just whitespace
-                if not content:
-                    return
-                
-                raw_entries = json.loads(content)
-                
-                # Build cache and completed_ids set
-                for entry in raw_entries:
-                    if 'playlist_id' in entry:
-                        self.cache[entry['playlist_id']] = entry
-                        if entry.get('status') == 'completed':
-                            self.completed_ids.add(entry['playlist_id'])
-                            
+            raw_entries, self._needs_compact, skipped = _load_history_log(self.history_file)
+            self._last_compact_size = os.path.getsize(self.history_file)
+            if skipped:
+                # Reported once; the compaction drops them from the log
+                print(f"Skipped {skipped} unreadable history record(s)")
+            
+            # Replay the log - later records replace earlier ones for the same playlist
+            for entry in raw_entries:
+                if 'playlist_id' in entry:
+                    self.cache[entry['playlist_id']] = entry
+                    self.cache.move_to_end(entry['playlist_id'])
+                    if entry.get('status') == 'completed':
+                        self.completed_ids.add(entry['playlist_id'])
+                    else:
+                        self.completed_ids.discard(entry['playlist_id'])
+            
+            self._trim_cache()
+                        
         except json.JSONDecodeError as e:
             print(f"Error loading history file: {e}")
             self._backup_corrupted_file()
@@ -55,89 +227,153 @@ class OptimizedJsonHistoryRepository:
         """Backup corrupted history file"""
         backup_file = f"{self.history_file}.bak.{int(time.time())}"
         try:
-            shutil.copy2(self.history_file, backup_file)
+            # Move it aside - the next save starts a fresh file in its place
+            os.replace(self.history_file, backup_file)
             print(f"Corrupted history file backed up to {backup_file}")
         except Exception as be:
             print(f"Failed to backup corrupted history: {be}")
         
-        # Create a new empty history file
-        with open(self.history_file, 'w') as f:
-            json.dump([], f)
-        
         # Reset cache and tracking
-        self.cache = {}
+        self.cache = OrderedDict()
         self.completed_ids = set()
+        self._evicted = False
     
     def save_entry(self, entry: Union[HistoryEntry, Dict[str, Any]]) -> None:
         """Save a history entry to memory cache and file"""
+        self.save_entries([entry])
+    
+    def save_entries(self, entries: List[Union[HistoryEntry, Dict[str, Any]]]) -> None:
+        """Save several history entries with a single file write"""
+        self.save_entry_dicts([_entry_to_dict(entry) for entry in entries])
+    
+    def save_entry_dict(self, entry: Dict[str, Any]) -> None:
+        """Save a history entry that is already a dict with an ISO timestamp string"""
+        self.save_entry_dicts([entry])
+    
+    def save_entry_dicts(self, entries: List[Dict[str, Any]]) -> None:
+        """Save already-serializable history dicts, no conversion; the file write is debounced"""
         self._ensure_loaded()
         
-        # Convert to dict for JSON serialization if not already a dict
-        if isinstance(entry, HistoryEntry):
-            entry_dict = {
-                'playlist_id': entry.playlist_id,
-                'playlist_title': entry.playlist_title,
-                'status': entry.status,
-                'timestamp': entry.timestamp.isoformat() if hasattr(entry.timestamp, 'isoformat') else entry.timestamp,
-                'download_path': entry.download_path
-            }
-        else:
-            # Already a dict, make sure timestamp is a string
-            entry_dict = dict(entry)  # Make a copy to avoid modifying the original
-            if 'timestamp' in entry_dict and hasattr(entry_dict['timestamp'], 'isoformat'):
-                entry_dict['timestamp'] = entry_dict['timestamp'].isoformat()
-        
-        playlist_id = entry_dict.get('playlist_id')
-        if not playlist_id:
-            raise ValueError("Entry must have a playlist_id")
+        with self._lock:
+            for entry_dict in entries:
+                playlist_id = entry_dict.get('playlist_id')
+                if not playlist_id:
+                    raise ValueError("Entry must have a playlist_id")
+                    
+                # Update cache as the most recently used entry
+                self.cache[playlist_id] = entry_dict
+                self.cache.move_to_end(playlist_id)
+                
+                # Update completed_ids tracking
+                if entry_dict.get('status') == 'completed':
+                    self.completed_ids.add(playlist_id)
+                else:
+                    self.completed_ids.discard(playlist_id)
+                
+                self._pending.append(entry_dict)
             
-        # Update cache
-        self.cache[playlist_id] = entry_dict
+            self._trim_cache()
+            self._wake_writer.set()
+    
+    def _trim_cache(self) -> None:
+        """Evict least recently used entries beyond max_cache; they stay in the log"""
+        while len(self.cache) > self.max_cache:
+            self.cache.popitem(last=False)
+            self._evicted = True
+    
+    def _writer_loop(self) -> None:
+        """Flush shortly after each burst of saves"""
+        while True:
+            self._wake_writer.wait()
+            time.sleep(_FLUSH_DELAY)  # Let the rest of the burst arrive
+            self._wake_writer.clear()
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write pending changes to the file now"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                compact = self._needs_compact
+                self._needs_compact = False
+            
+            # Serialize and write outside _lock so saves aren't blocked on disk I/O
+            if compact:
+                # The file can't take appends as is (old format, a torn record, or cleared)
+                self._save_to_file(self._full_history(pending))
+            elif pending:
+                self._append_to_file(pending)
+                self._maybe_compact()
+    
+    def _full_history(self, pending: List[Dict[str, Any]] = ()) -> List[Dict[str, Any]]:
+        """Every entry, including evicted ones (call with _flush_lock held).
+        
+        Pending records not yet in the file must be passed in, since evicted ones are
+        no longer in the cache either.
+        """
+        with self._lock:
+            evicted = self._evicted
+            cached = list(self.cache.values())
+        if not evicted:
+            return cached
+        
+        # Replay the log, then newer records on top: unwritten ones, then the cache
+        merged = OrderedDict()
+        try:
+            records = _load_history_log(self.history_file)[0]
+        except (OSError, ValueError) as e:
+            print(f"Error reading history file: {e}")
+            records = []
+        for entry in itertools.chain(records, pending, cached):
+            playlist_id = entry.get('playlist_id')
+            if playlist_id:
+                merged[playlist_id] = entry
+                merged.move_to_end(playlist_id)
+        return list(merged.values())
+    
+    def _history_dicts(self) -> List[Dict[str, Any]]:
+        """All entries as dicts, reading evicted ones back from the log"""
+        self._ensure_loaded()
+        if not self._evicted:
+            return list(self.cache.values())
         
-        # Update completed_ids tracking
-        if entry_dict.get('status') == 'completed':
-            self.completed_ids.add(playlist_id)
-        elif playlist_id in self.completed_ids and entry_dict.get('status') != 'completed':
-            self.completed_ids.remove(playlist_id)
+        self.flush()
+        with self._flush_lock:
+            return self._full_history()
+    
+    def _append_to_file(self, entries: List[Dict[str, Any]]) -> None:
+        """Append one record per entry to the log"""
+        try:
+            with open(self.history_file, 'ab') as f:
+                f.write(b''.join(_dumps_compact(entry) + b'\n' for entry in entries))
+        except Exception as e:
+            print(f"Error saving history to file: {e}")
+    
+    def _maybe_compact(self) -> None:
+        """Rewrite the log with one record per playlist once superseded records pile up"""
+        try:
+            size = os.path.getsize(self.history_file)
+        except OSError:
+            return
+        if size <= self._last_compact_size * 2 + _COMPACT_SLACK:
+            return
         
-        # Write entire cache to file (could be optimized with delayed writing)
-        self._save_to_file()
+        self._save_to_file(self._full_history())
     
-    def _save_to_file(self):
-        """Save cache to file"""
+    def _save_to_file(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the log with exactly the given entries"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(list(self.cache.values()), f, indent=2)
+            data = b''.join(_dumps_compact(entry) + b'\n' for entry in entries)
+            _atomic_write(self.history_file, data)
+            self._last_compact_size = len(data)
         except Exception as e:
             print(f"Error saving history to file: {e}")
     
     def load_history(self) -> List[HistoryEntry]:
         """Load history entries as HistoryEntry objects"""
-        self._ensure_loaded()
-        
-        entries = []
-        for item in self.cache.values():
-            try:
-                # Convert timestamp string to datetime
-                if isinstance(item.get('timestamp'), str):
-                    timestamp = datetime.fromisoformat(item['timestamp'])
-                else:
-                    timestamp = datetime.now()  # Fallback
-                
-                entry = HistoryEntry(
-                    playlist_id=item['playlist_id'],
-                    playlist_title=item['playlist_title'],
-                    status=item['status'],
-                    timestamp=timestamp,
-                    download_path=item['download_path']
-                )
-                entries.append(entry)
-            except Exception as e:
-                print(f"Error converting history entry: {e}")
-                # Skip invalid entries
-                continue
-        
-        return entries
+        # Invalid entries are skipped
+        entries = map(_entry_from_dict, self._history_dicts())
+        return [entry for entry in entries if entry is not None]
     
     def find_by_playlist_id(self, playlist_id: str) -> Optional[HistoryEntry]:
         """Find a history entry by playlist ID with caching"""
@@ -147,28 +383,20 @@ class OptimizedJsonHistoryRepository:
         if playlist_id not in self.completed_ids:
             return None
             
-        # Get from cache
-        entry_dict = self.cache.get(playlist_id)
-        if not entry_dict or entry_dict.get('status') != 'completed':
-            return None
-            
-        try:
-            # Convert timestamp string to datetime
-            if isinstance(entry_dict.get('timestamp'), str):
-                timestamp = datetime.fromisoformat(entry_dict['timestamp'])
-            else:
-                timestamp = datetime.now()  # Fallback
-            
-            return HistoryEntry(
-                playlist_id=entry_dict['playlist_id'],
-                playlist_title=entry_dict['playlist_title'],
-                status=entry_dict['status'],
-                timestamp=timestamp,
-                download_path=entry_dict['download_path']
+        # Get from cache, falling back to the log for evicted entries
+        with self._lock:
+            entry_dict = self.cache.get(playlist_id)
+            if entry_dict is not None:
+                self.cache.move_to_end(playlist_id)
+        if entry_dict is None and self._evicted:
+            entry_dict = next(
+                (item for item in self._history_dicts() if item.get('playlist_id') == playlist_id),
+                None
             )
-        except Exception as e:
-            print(f"Error converting history entry: {e}")
+        if not entry_dict or entry_dict.get('status') != 'completed':
             return None
+        
+        return _entry_from_dict(entry_dict)
     
     def is_duplicate(self, playlist_id: str) -> bool:
         """Fast check if a playlist has been completed"""
@@ -177,9 +405,17 @@ class OptimizedJsonHistoryRepository:
     
     def clear_history(self) -> None:
         """Clear all history"""
-        self.cache = {}
-        self.completed_ids = set()
-        self._save_to_file()
+        self._ensure_loaded()  # So a later first load can't bring the old entries back
+        
+        with self._lock:
+            # Pending records are dropped; the writer rewrites the log as empty
+            self.cache = OrderedDict()
+            self.completed_ids = set()
+            self._evicted = False
+            self._pending = []
+            self._needs_compact = True
+        
+        self._wake_writer.set()
 
 
 class JsonConfigurationRepository:
@@ -187,213 +423,65 @@ class JsonConfigurationRepository:
     
     def __init__(self, config_file: str = "downloader_config.json"):
         self.config_file = config_file
+        
+        # Last config read or written, reused until the file's mtime changes
+        self._cached_config: Optional[DownloadConfig] = None
+        self._cached_mtime: Optional[int] = None
     
     def load_config(self) -> DownloadConfig:
         """Load configuration from JSON file"""
-        default_config = DownloadConfig()
-        
-        if not os.path.exists(self.config_file):
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            default_config = DownloadConfig()
             self.save_config(default_config)
             return default_config
         
+        if self._cached_config is not None and mtime == self._cached_mtime:
+            return replace(self._cached_config)  # Callers may modify what they get back
+        
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
-                # Convert quality string to enum if present
-                if 'default_quality' in data:
-                    data['default_quality'] = DownloadQuality(data['default_quality'])
-                    
-                # Handle new performance optimization settings
-                if 'quick_mode' not in data:
-                    data['quick_mode'] = False
-                if 'skip_validation' not in data:
-                    data['skip_validation'] = False
-                if 'skip_metadata' not in data:
-                    data['skip_metadata'] = False
-                if 'throttle_progress' not in data:
-                    data['throttle_progress'] = True
-                if 'cache_lifetime' not in data:
-                    data['cache_lifetime'] = 3600
-                if 'use_memory_cache' not in data:
-                    data['use_memory_cache'] = True
-                if 'parallel_downloads' not in data:
-                    data['parallel_downloads'] = 0
-                
-                return DownloadConfig(**data)
-        except Exception:
-            return default_config
+            with open(self.config_file, 'rb') as f:
+                data = _loads(f.read())
+            # Convert quality string to enum if present; unknown values fall back to best
+            if 'default_quality' in data:
+                data['default_quality'] = _QUALITY_BY_VALUE.get(data['default_quality'], DownloadQuality.BEST)
+            
+            # Settings missing from older files take the DownloadConfig defaults
+            config = DownloadConfig(**data)
+        except (OSError, ValueError, TypeError) as e:
+            # Unreadable JSON or unknown settings - report it and run on defaults
+            print(f"Error loading config file: {e}")
+            return DownloadConfig()
+        
+        self._cached_config, self._cached_mtime = replace(config), mtime
+        return config
     
     def save_config(self, config: DownloadConfig) -> None:
         """Save configuration to JSON file"""
-        data = {
-            'download_directory': config.download_directory,
-            'max_concurrent_downloads': config.max_concurrent_downloads,
-            'default_quality': config.default_quality.value,
-            'retry_count': config.retry_count,
-            'auto_retry_failed': config.auto_retry_failed,
-            'check_duplicates': config.check_duplicates,
-            'bandwidth_limit': config.bandwidth_limit,
-            'cookie_method': config.cookie_method,
-            'cookie_file': config.cookie_file,
-            'output_template': config.output_template,
-            'create_playlist_folder': config.create_playlist_folder,
-            'sanitize_filenames': config.sanitize_filenames,
-            'preferred_format': config.preferred_format,
-            'use_postprocessing': config.use_postprocessing,
-            
-            # Performance optimization settings
-            'quick_mode': getattr(config, 'quick_mode', False),
-            'skip_validation': getattr(config, 'skip_validation', False),
-            'skip_metadata': getattr(config, 'skip_metadata', False),
-            'throttle_progress': getattr(config, 'throttle_progress', True),
-            'cache_lifetime': getattr(config, 'cache_lifetime', 3600),
-            'use_memory_cache': getattr(config, 'use_memory_cache', True),
-            'parallel_downloads': getattr(config, 'parallel_downloads', 0)
-        }
+        data = {name: getattr(config, name) for name in _CONFIG_FIELDS}
+        data['default_quality'] = config.default_quality.value
+        
+        _atomic_write(self.config_file, _dumps(data))
         
-        with open(self.config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        try:
+            self._cached_config = replace(config)
+            self._cached_mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            self._cached_config = None
 
 
-class JsonHistoryRepository:
-    """JSON file-based history storage with improved serialization"""
+class JsonHistoryRepository(OptimizedJsonHistoryRepository):
+    """Deprecated alias of OptimizedJsonHistoryRepository, kept for existing imports"""
     
     def __init__(self, history_file: str = "download_history.json"):
-        self.history_file = history_file
-    
-    def save_entry(self, entry: Union[HistoryEntry, Dict[str, Any]]) -> None:
-        """Save a history entry to file, handles both HistoryEntry objects and dicts"""
-        history = self.load_history_as_dicts()
-        
-        # Convert to dict for JSON serialization if not already a dict
-        if isinstance(entry, HistoryEntry):
-            entry_dict = {
-                'playlist_id': entry.playlist_id,
-                'playlist_title': entry.playlist_title,
-                'status': entry.status,
-                'timestamp': entry.timestamp.isoformat() if hasattr(entry.timestamp, 'isoformat') else entry.timestamp,
-                'download_path': entry.download_path
-            }
-        else:
-            # Already a dict, make sure timestamp is a string
-            entry_dict = dict(entry)  # Make a copy to avoid modifying the original
-            if 'timestamp' in entry_dict and hasattr(entry_dict['timestamp'], 'isoformat'):
-                entry_dict['timestamp'] = entry_dict['timestamp'].isoformat()
-        
-        # Remove any existing entries with the same ID 
-        history = [e for e in history if e.get('playlist_id') != entry_dict.get('playlist_id')]
-        
-        # Add the new entry
-        history.append(entry_dict)
-        
-        # Save to file
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2)
-    
-    def load_history(self) -> List[HistoryEntry]:
-        """Load history entries as HistoryEntry objects"""
-        history_dicts = self.load_history_as_dicts()
-        
-        entries = []
-        for item in history_dicts:
-            try:
-                # Convert timestamp string to datetime
-                if isinstance(item.get('timestamp'), str):
-                    timestamp = datetime.fromisoformat(item['timestamp'])
-                else:
-                    timestamp = datetime.now()  # Fallback
-                
-                entry = HistoryEntry(
-                    playlist_id=item['playlist_id'],
-                    playlist_title=item['playlist_title'],
-                    status=item['status'],
-                    timestamp=timestamp,
-                    download_path=item['download_path']
-                )
-                entries.append(entry)
-            except Exception as e:
-                print(f"Error converting history entry: {e}")
-                # Skip invalid entries
-                continue
-        
-        return entries
+        warnings.warn(
+            "JsonHistoryRepository is deprecated, use OptimizedJsonHistoryRepository",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        super().__init__(history_file)
     
     def load_history_as_dicts(self) -> List[Dict[str, Any]]:
-        """Load raw history entries as dictionaries with improved error handling"""
-        if not os.path.exists(self.history_file):
-            # Create an empty history file if it doesn't exist
-            with open(self.history_file, 'w') as f:
-                json.dump([], f)
-            return []
-        
-        try:
-            with open(self.history_file, 'r') as f:
-                content = f.read().strip()
-                # Check if file is empty or just whitespace
-                if not content:
-                    return []
-                
-                return json.loads(content)
-        except json.JSONDecodeError as e:
-            error_msg = f"Error loading history file: {e}"
-            print(error_msg)
-            
-            # Backup corrupted file
-            backup_file = f"{self.history_file}.bak.{int(time.time())}"
-            try:
-                shutil.copy2(self.history_file, backup_file)
-                print(f"Corrupted history file backed up to {backup_file}")
-            except Exception as be:
-                print(f"Failed to backup corrupted history: {be}")
-            
-            # Create a new empty history file
-            with open(self.history_file, 'w') as f:
-                json.dump([], f)
-            
-            return []
-        except Exception as e:
-            print(f"Unexpected error loading history file: {e}")
-            return []
-
-    def find_by_playlist_id(self, playlist_id: str) -> Optional[HistoryEntry]:
-        """Find a history entry by playlist ID with error handling"""
-        try:
-            # For better performance, first try to find it in the raw dicts
-            for entry_dict in self.load_history_as_dicts():
-                if entry_dict.get('playlist_id') == playlist_id and entry_dict.get('status') == 'completed':
-                    # Found a match, convert to HistoryEntry
-                    try:
-                        # Convert timestamp string to datetime
-                        if isinstance(entry_dict.get('timestamp'), str):
-                            timestamp = datetime.fromisoformat(entry_dict['timestamp'])
-                        else:
-                            timestamp = datetime.now()  # Fallback
-                        
-                        return HistoryEntry(
-                            playlist_id=entry_dict['playlist_id'],
-                            playlist_title=entry_dict['playlist_title'],
-                            status=entry_dict['status'],
-                            timestamp=timestamp,
-                            download_path=entry_dict['download_path']
-                        )
-                    except Exception as e:
-                        print(f"Error converting history entry: {e}")
-                        return None
-            
-            # Not found
-            return None
-        except Exception as e:
-            print(f"Error searching history: {e}")
-            return None
-    
-    def is_duplicate(self, playlist_id: str) -> bool:
-        """Check if a playlist ID is a duplicate (has been completed)"""
-        # This is less efficient than the optimized version
-        # but provided for backward compatibility
-        entry = self.find_by_playlist_id(playlist_id)
-        return entry is not None and entry.status == 'completed'
-    
-    def clear_history(self) -> None:
-        """Clear all history"""
-        with open(self.history_file, 'w') as f:
-            json.dump([], f)
\ No newline at end of file
+        """Load raw history entries as dictionaries"""
+        return self._history_dicts()
@@ -1,24 +1,17 @@
 import tkinter as tk
 import os
+import time
+from functools import partial
+from typing import Dict
 
 # Import improvements
 from src.utils.path_utils import PathUtils
-from src.utils.performance_utils import ProgressThrottler, Debouncer
-from src.ui.theme.theme_manager import ThemeManager
-from src.ui.tabs.theme_tab import ThemeTab
+from src.utils.performance_utils import Debouncer
     
-# Import optimized repositories
-from src.data.repositories import OptimizedJsonHistoryRepository, JsonConfigurationRepository
-from src.data.env_config import EnvironmentConfigRepository
-
-# Import optimized validators
-from src.core.validators import OptimizedYouTubeCookieValidator, FileNameSanitizer, QualityFormatter
-    
-# Original imports
-from src.data.models import DownloadProgress
-from src.core.download_service import DownloadService
+# Original imports - base classes of the enhanced versions below. Everything only
+# needed to assemble the application is imported in create_enhanced_application.
+from src.data.models import DownloadProgress, DownloadStatus
 from src.core.downloader import YouTubePlaylistDownloader
-from src.ui.presenters import DownloadPresenter, HistoryPresenter, SettingsPresenter
 from src.ui.gui import YouTubeDownloaderApp
 from src.ui.tabs.download_tab import DownloadTab
 from src.utils.logging_utils import get_logger
@@ -30,6 +23,8 @@ class EnhancedYouTubeDownloaderApp(YouTubeDownloaderApp):
     """Enhanced version of the YouTube Downloader App with improvements"""
     
     def __init__(self, download_presenter, history_presenter, settings_presenter):
+        from src.ui.theme.theme_manager import ThemeManager
+        
         # Initialize theme manager before the UI
         self.theme_manager = ThemeManager()
         
@@ -48,37 +43,57 @@ class EnhancedYouTubeDownloaderApp(YouTubeDownloaderApp):
         super().create_widgets()
         
         # Add theme tab
+        from src.ui.tabs.theme_tab import ThemeTab
         self.theme_tab = ThemeTab(self.notebook, self.theme_manager)
         self.notebook.add(self.theme_tab, text="Theme")
     
+    def _on_tab_created(self, tab):
+        """Style tabs built after the theme was applied"""
+        self.theme_manager._configure_widgets(tab, self.theme_manager.get_current_theme())
+    
     def _add_theme_menu(self):
         """Add theme selection to menu bar"""
+        # Only ever add one Theme cascade
+        if hasattr(self, 'theme_menu'):
+            return
+        
         # Create menu bar if not exists
         if not hasattr(self, 'menu_bar'):
             self.menu_bar = tk.Menu(self)
             self.config(menu=self.menu_bar)
         
-        # Create theme menu
-        theme_menu = tk.Menu(self.menu_bar, tearoff=0)
-        
-        # Add theme options
-        for theme_id in self.theme_manager.get_theme_ids():
-            theme = self.theme_manager.themes[theme_id]
-            theme_menu.add_command(
-                label=theme.name,
-                command=lambda tid=theme_id: self.theme_manager.set_current_theme(tid)
-            )
+        # Create theme menu; its entries are filled in each time it is opened,
+        # so themes added or removed since startup show up
+        self.theme_menu = tk.Menu(self.menu_bar, tearoff=0, postcommand=self._populate_theme_menu)
+        self._theme_menu_sig = None  # (theme_id, name) pairs the entries were built from
         
         # Add theme menu to menu bar
-        self.menu_bar.add_cascade(label="Theme", menu=theme_menu)
+        self.menu_bar.add_cascade(label="Theme", menu=self.theme_menu)
+    
+    def _populate_theme_menu(self):
+        """Rebuild the theme menu entries if the themes changed since the last build"""
+        themes = self.theme_manager.themes
+        sig = tuple((theme_id, themes[theme_id].name) for theme_id in self.theme_manager.get_theme_ids())
+        if sig == self._theme_menu_sig:
+            return
+        
+        self.theme_menu.delete(0, 'end')
+        for theme_id, name in sig:
+            self.theme_menu.add_command(
+                label=name,
+                command=partial(self.theme_manager.set_current_theme, theme_id)
+            )
+        self._theme_menu_sig = sig
 
 
 class EnhancedDownloadTab(DownloadTab):
     """Enhanced version of the Download tab with performance improvements"""
     
+    PROGRESS_INTERVAL = 0.25  # Minimum seconds between downloading updates per playlist
+    
     def __init__(self, parent, presenter, **kwargs):
         # Initialize throttlers before parent constructor
-        self.progress_throttler = ProgressThrottler(base_interval=0.25)
+        self._last_emit: Dict[str, float] = {}  # playlist_id -> monotonic time of last accepted update
         self.status_debouncer = Debouncer(delay=0.5)
         
         # Call parent constructor
@@ -86,15 +101,16 @@ class EnhancedDownloadTab(DownloadTab):
     
     def update_progress(self, progress: DownloadProgress):
         """Override to throttle progress updates"""
-        # Use throttler to determine if we should update
-        if self.progress_throttler.should_update(
-            progress.playlist_id, 
-            progress.progress,
-            progress.status.value,
-            progress.message
-        ):
-            # Call parent method to update UI
-            super().update_progress(progress)
+        # Keep this to a dict lookup and a clock read. Status changes and completion
+        # always go through.
+        if progress.status is DownloadStatus.DOWNLOADING and progress.progress < 100:
+            now = time.monotonic()
+            if now - self._last_emit.get(progress.playlist_id, 0.0) < self.PROGRESS_INTERVAL:
+                return
+            self._last_emit[progress.playlist_id] = now
+        
+        # Call parent method to update UI
+        super().update_progress(progress)
     
     def update_status(self, message: str):
         """Override to debounce status updates"""
@@ -121,11 +137,13 @@ class EnhancedYouTubePlaylistDownloader(YouTubePlaylistDownloader):
             self.logger.error(f"Invalid base directory: {message}")
             raise ValueError(f"Invalid download directory: {message}")
         
-        # Ensure base directory exists
-        ensured, message = PathUtils.ensure_directory(base_dir)
-        if not ensured:
-            self.logger.error(f"Failed to create base directory: {message}")
-            raise ValueError(f"Failed to create download directory: {message}")
+        # Ensure base directory exists (once per instance - it's shared by every playlist)
+        if base_dir not in self._ensured_dirs:
+            ensured, message = PathUtils.ensure_directory(base_dir)
+            if not ensured:
+                self.logger.error(f"Failed to create base directory: {message}")
+                raise ValueError(f"Failed to create download directory: {message}")
+            self._ensured_dirs.add(base_dir)
             
         # Create safe path for playlist folder
         sanitized_title = PathUtils.sanitize_filename(playlist_title)
@@ -141,10 +159,12 @@ class EnhancedYouTubePlaylistDownloader(YouTubePlaylistDownloader):
             self.logger.info(f"Using truncated path: {folder_path}")
         
         # Create the directory
-        ensured, message = PathUtils.ensure_directory(folder_path)
-        if not ensured:
-            self.logger.error(f"Failed to create playlist directory: {message}")
-            raise ValueError(f"Failed to create playlist directory: {message}")
+        if folder_path not in self._ensured_dirs:
+            ensured, message = PathUtils.ensure_directory(folder_path)
+            if not ensured:
+                self.logger.error(f"Failed to create playlist directory: {message}")
+                raise ValueError(f"Failed to create playlist directory: {message}")
+            self._ensured_dirs.add(folder_path)
             
         return folder_path
     
@@ -194,6 +214,14 @@ class EnhancedYouTubePlaylistDownloader(YouTubePlaylistDownloader):
 
 def create_enhanced_application():
     """Create enhanced application with all improvements"""
+    from src.data.repositories import OptimizedJsonHistoryRepository
+    from src.data.env_config import EnvironmentConfigRepository
+    from src.core.validators import OptimizedYouTubeCookieValidator, FileNameSanitizer, QualityFormatter
+    from src.core.download_service import DownloadService
+    from src.ui.presenters import (
+        DownloadPresenter, HistoryPresenter, SettingsPresenter, create_background_executor
+    )
+    
     # Get the logger from your utility instead of using Python's logging directly
     logger = get_logger(__name__)
     
@@ -228,12 +256,14 @@ def create_enhanced_application():
         logger=get_logger('DownloadService')
     )
     
-    # Create presenters
+    # Create presenters; they share one pool for work kept off the UI thread
+    background_executor = create_background_executor()
     download_presenter = DownloadPresenter(
         download_service=download_service,
         config_repository=config_repository,
         history_repository=history_repository,
-        logger=get_logger('DownloadPresenter')
+        logger=get_logger('DownloadPresenter'),
+        executor=background_executor
     )
     
     history_presenter = HistoryPresenter(
@@ -242,7 +272,8 @@ def create_enhanced_application():
     
     settings_presenter = SettingsPresenter(
         config_repository=config_repository,
-        cookie_validator=cookie_validator
+        cookie_validator=cookie_validator,
+        executor=background_executor
     )
     
     # Create enhanced application
@@ -257,6 +288,7 @@ def create_enhanced_application():
     # creates its own tabs during initialization
     download_tab = EnhancedDownloadTab(app.notebook, download_presenter)
     app.notebook.forget(0)  # Remove the original tab
+    app.download_tab.destroy()  # Also drops its presenter subscriptions
     app.notebook.insert(0, download_tab, text="Download")
     app.download_tab = download_tab
     
@@ -1,6 +1,7 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import logging
+import time
 
 from src.ui.presenters import DownloadPresenter, HistoryPresenter, SettingsPresenter
 from src.ui.tabs.download_tab import DownloadTab
@@ -15,6 +16,15 @@ logger = get_logger(__name__)
 class YouTubeDownloaderApp(tk.Tk):
     """Main application window"""
     
+    # How often pending download progress is applied to the widgets. While nothing
+    # arrives the interval backs off to PROGRESS_IDLE_MS so an idle app barely wakes up.
+    PROGRESS_DRAIN_MS = 50
+    PROGRESS_IDLE_MS = 400
+    
+    # While quitting, how often to check whether downloads have stopped and how long to wait
+    SHUTDOWN_POLL_MS = 50
+    SHUTDOWN_TIMEOUT = 10.0
+    
     def __init__(self, 
                  download_presenter: DownloadPresenter,
                  history_presenter: HistoryPresenter,
@@ -36,7 +46,29 @@ class YouTubeDownloaderApp(tk.Tk):
         self.logger.info("Application UI initialized")
         
         # Handle window close
+        self._quit_dialog = None
+        self._stop_thread = None
+        self._stop_deadline = 0.0
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Progress from download threads is applied on the Tk thread at most once per tick
+        self._drain_interval = self.PROGRESS_DRAIN_MS
+        self.after(self._drain_interval, self._drain_progress)
+    
+    def _drain_progress(self):
+        """Apply pending download status and progress, then reschedule"""
+        try:
+            active = self.download_presenter.drain_progress()
+        except Exception as e:
+            self.logger.error(f"Error applying progress update: {e}")
+            active = True
+        
+        # Poll quickly while progress is flowing, back off while idle
+        if active:
+            self._drain_interval = self.PROGRESS_DRAIN_MS
+        else:
+            self._drain_interval = min(self._drain_interval * 2, self.PROGRESS_IDLE_MS)
+        self.after(self._drain_interval, self._drain_progress)
     
     def create_widgets(self):
         """Create main application widgets"""
@@ -48,17 +80,89 @@ class YouTubeDownloaderApp(tk.Tk):
         self.download_tab = DownloadTab(self.notebook, self.download_presenter)
         self.notebook.add(self.download_tab, text="Download")
         
-        self.history_tab = HistoryTab(self.notebook, self.history_presenter)
-        self.notebook.add(self.history_tab, text="History")
-        
-        self.settings_tab = SettingsTab(self.notebook, self.settings_presenter)
-        self.notebook.add(self.settings_tab, text="Settings")
+        # History and Settings are built on first view - loading history and
+        # validating cookies is wasted startup work for users who never open them
+        self.history_tab = None
+        self.settings_tab = None
+        self._lazy_tabs = {}
+        self._add_lazy_tab('history_tab', "History", lambda: HistoryTab(self.notebook, self.history_presenter))
+        self._add_lazy_tab('settings_tab', "Settings", lambda: SettingsTab(self.notebook, self.settings_presenter))
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         self.logger.debug("All tabs created and added to notebook")
+    
+    def _add_lazy_tab(self, attr: str, text: str, factory):
+        """Add a placeholder frame that is replaced by the real tab when first selected"""
+        placeholder = ttk.Frame(self.notebook)
+        self.notebook.add(placeholder, text=text)
+        self._lazy_tabs[str(placeholder)] = (placeholder, attr, text, factory)
+    
+    def _on_tab_changed(self, event=None):
+        """Swap in the real tab the first time its placeholder is selected"""
+        # Pop before swapping: forget() below fires this event again
+        lazy = self._lazy_tabs.pop(self.notebook.select(), None)
+        if lazy is None:
+            return
+        
+        placeholder, attr, text, factory = lazy
+        index = self.notebook.index(placeholder)
+        tab = factory()
+        setattr(self, attr, tab)
+        
+        self.notebook.forget(index)
+        self.notebook.insert(index, tab, text=text)
+        self.notebook.select(tab)
+        placeholder.destroy()
+        self._on_tab_created(tab)
+        self.logger.debug(f"{text} tab created on first view")
+    
+    def _on_tab_created(self, tab):
+        """Hook for subclasses to set up a tab that was created lazily"""
+        pass
         
     def on_closing(self):
         """Handle application close"""
-        if messagebox.askokcancel("Quit", "Do you want to quit? Any active downloads will be stopped."):
-            self.logger.info("Application closing, stopping downloads")
-            self.download_presenter.stop_downloads()
-            self.destroy()
\ No newline at end of file
+        # Already asking or already shutting down
+        if self._quit_dialog is not None or self._stop_thread is not None:
+            return
+        
+        # A Toplevel instead of messagebox keeps the main loop (and progress) running
+        dialog = tk.Toplevel(self)
+        dialog.title("Quit")
+        dialog.transient(self)
+        dialog.resizable(False, False)
+        dialog.protocol("WM_DELETE_WINDOW", self._cancel_quit)
+        
+        ttk.Label(dialog, text="Do you want to quit? Any active downloads will be stopped.",
+                  padding=15).pack()
+        buttons = ttk.Frame(dialog, padding=(0, 0, 0, 10))
+        buttons.pack()
+        ttk.Button(buttons, text="OK", command=self._confirm_quit).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Cancel", command=self._cancel_quit).pack(side=tk.LEFT, padx=5)
+        
+        dialog.grab_set()
+        self._quit_dialog = dialog
+    
+    def _cancel_quit(self):
+        """Close the quit dialog and keep running"""
+        self._quit_dialog.destroy()
+        self._quit_dialog = None
+    
+    def _confirm_quit(self):
+        """Stop downloads in the background and close once they have stopped"""
+        self._cancel_quit()
+        self.logger.info("Application closing, stopping downloads")
+        self._stop_thread = self.download_presenter.stop_downloads_in_background()
+        self._stop_deadline = time.monotonic() + self.SHUTDOWN_TIMEOUT
+        self.after(self.SHUTDOWN_POLL_MS, self._await_stop)
+    
+    def _await_stop(self):
+        """Destroy the window once downloads have stopped (or the timeout passed)"""
+        if self._stop_thread.is_alive() and time.monotonic() < self._stop_deadline:
+            self.after(self.SHUTDOWN_POLL_MS, self._await_stop)
+            return
+        
+        if self._stop_thread.is_alive():
+            self.logger.warning("Downloads did not stop in time, closing anyway")
+        self.download_presenter.shutdown()
+        self.destroy()
\ No newline at end of file
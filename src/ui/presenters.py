@@ -1,40 +1,97 @@
 # presenters.py - Presenter layer for handling UI interactions
 
 import logging
+import threading
 import time
-from typing import List, Optional, Callable
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import List, Optional, Callable, Dict, Tuple
 
-from src.data.models import DownloadConfig, DownloadProgress, HistoryEntry
+from src.data.models import DownloadConfig, DownloadProgress, DownloadStatus, HistoryEntry
 from src.core.interfaces import (
     ConfigurationRepository, HistoryRepository, ProgressListener
 )
 from src.core.download_service import DownloadService
 from src.utils.logging_utils import get_logger
 
+BACKGROUND_WORKERS = 4  # Enough for UI-side work (download start, settings save) without oversubscribing
+
+
+def create_background_executor() -> ThreadPoolExecutor:
+    """Thread pool for presenter work that must not block the UI thread"""
+    return ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix='presenter-bg')
+
+
+class PresenterBus:
+    """Dispatches presenter events to the callbacks subscribed to them"""
+    
+    # Events: 'progress', 'status', 'playlist_complete', 'playlist_failed', 'all_complete',
+    # 'start_failed'
+    __slots__ = ('_subscribers',)
+    
+    def __init__(self):
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
+    
+    def subscribe(self, event: str, callback: Callable) -> None:
+        """Register a callback for an event"""
+        # Tuples are replaced, never mutated, so emit can iterate them without a lock
+        self._subscribers[event] = self._subscribers.get(event, ()) + (callback,)
+    
+    def unsubscribe(self, event: str, callback: Callable) -> None:
+        """Remove a callback registered for an event"""
+        self._subscribers[event] = tuple(cb for cb in self._subscribers.get(event, ()) if cb != callback)
+    
+    def subscribers(self, event: str) -> Tuple[Callable, ...]:
+        """Callbacks registered for an event"""
+        return self._subscribers.get(event, ())
+    
+    def emit(self, event: str, *args) -> None:
+        """Call every callback registered for an event"""
+        for callback in self._subscribers.get(event, ()):
+            callback(*args)
+
+
 class DownloadPresenter(ProgressListener):
     """Presenter for download tab functionality"""
     
+    # Long-lived and touched on every progress tick - slots avoid a per-instance __dict__
+    __slots__ = ('logger', 'download_service', 'config_repository', 'history_repository',
+                 'executor', 'bus', '_pending_progress', '_pending_status', '_pending_events', '_pending_lock',
+                 '_progress_state', '_progress_throttle_interval')
+    
+    PROGRESS_STATE_MAX = 256  # Playlists whose throttle state is kept
+    
     def __init__(self,
                  download_service: DownloadService,
                  config_repository: ConfigurationRepository,
                  history_repository: HistoryRepository,
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 executor: Optional[Executor] = None):
         # Use provided logger or get one based on module name
         self.logger = logger or get_logger(f"{__name__}.DownloadPresenter")
         
+        # Runs blocking service calls off the UI thread; usually shared with the other presenters
+        self.executor = executor or create_background_executor()
+        
         self.download_service = download_service
         self.config_repository = config_repository
         self.history_repository = history_repository
         
-        # UI callbacks
-        self.on_progress_callback: Optional[Callable[[DownloadProgress], None]] = None
-        self.on_status_change_callback: Optional[Callable[[str], None]] = None
-        self.on_playlist_complete_callback: Optional[Callable[[str], None]] = None
-        self.on_playlist_failed_callback: Optional[Callable[[str, str], None]] = None
-        self.on_all_complete_callback: Optional[Callable[[], None]] = None
+        # UI callbacks, subscribed by event name
+        self.bus = PresenterBus()
+        
+        # Latest progress per playlist and latest status message, written by download
+        # threads and drained by the UI
+        self._pending_progress: Dict[str, DownloadProgress] = {}
+        self._pending_status: Optional[str] = None
+        self._pending_events: List[tuple] = []  # (event, *args) raised off the UI thread
+        self._pending_lock = threading.Lock()
         
         # Progress throttling
-        self._last_progress_update = {}  # Dict to track last update time per playlist
+        # playlist_id -> (monotonic time, progress) of last update; UI thread only. Dropped
+        # when a playlist's finish event is delivered, and capped LRU-style so long
+        # sessions don't accumulate entries
+        self._progress_state: OrderedDict[str, Tuple[float, float]] = OrderedDict()
         self._progress_throttle_interval = 0.25  # Update UI max 4 times per second
     
     def load_config(self) -> DownloadConfig:
@@ -54,14 +111,12 @@ class DownloadPresenter(ProgressListener):
         config = self.load_config()
         self._update_status("Starting downloads...")
         
-        success = self.download_service.start_downloads(
-            playlist_ids, config, self, quick_mode=False
+        # Cookie validation and queue setup happen off the UI thread; a failure is
+        # reported through the 'start_failed' event
+        self._run_in_background(
+            self.download_service.start_downloads, playlist_ids, config, self,
+            quick_mode=False, on_done=self._handle_start_result
         )
-        
-        if not success:
-            self._update_status("Failed to start downloads. Check your settings.")
-            return False
-        
         return True
 
     def start_downloads_quick(self, playlist_ids: List[str], config: DownloadConfig) -> bool:
@@ -77,15 +132,48 @@ class DownloadPresenter(ProgressListener):
         self._update_status("Starting quick downloads (minimal checks)...")
         
         # Use a special quick download method that skips checks
-        success = self.download_service.start_downloads(
-            playlist_ids, config, self, quick_mode=True
+        self._run_in_background(
+            self.download_service.start_downloads, playlist_ids, config, self,
+            quick_mode=True, on_done=self._handle_start_result
         )
+        return True
+    
+    def _run_in_background(self, fn: Callable, *args, on_done: Callable, **kwargs) -> None:
+        """Run fn on the executor and pass its result (None if it raised) to on_done there"""
+        def done(future: Future):
+            try:
+                result = future.result()
+            except Exception as e:
+                self.logger.error(f"Background task failed: {e}")
+                result = None
+            on_done(result)
         
+        self.executor.submit(fn, *args, **kwargs).add_done_callback(done)
+    
+    def shutdown(self) -> None:
+        """Stop the background executor, dropping work that has not started"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _handle_start_result(self, success) -> None:
+        """Report a download start that failed (runs on the background thread)"""
         if not success:
             self._update_status("Failed to start downloads. Check your settings.")
-            return False
-        
-        return True
+            self._post('start_failed')
+    
+    def _post(self, event: str, *args) -> None:
+        """Emit a bus event on the UI thread, now or from the next drain_progress"""
+        if threading.current_thread() is threading.main_thread():
+            self._emit_event(event, *args)
+        else:
+            with self._pending_lock:
+                self._pending_events.append((event, *args))
+    
+    def _emit_event(self, event: str, *args) -> None:
+        """Emit a bus event (UI thread); a finished playlist's throttle state goes with it"""
+        if event in ('playlist_complete', 'playlist_failed'):
+            # Only the UI thread touches _progress_state, so this can't race the drain
+            self._progress_state.pop(args[0], None)
+        self.bus.emit(event, *args)
     
     def pause_downloads(self) -> None:
         """Pause downloads"""
@@ -100,11 +188,19 @@ class DownloadPresenter(ProgressListener):
     def stop_downloads(self) -> None:
         """Stop downloads"""
         self.download_service.stop_downloads()
+        with self._pending_lock:
+            self._pending_progress.clear()  # Would land on the reset UI
         self._update_status("Downloads cancelled")
         
         # Manually trigger UI reset since we're not going through the normal completion flow
-        if self.on_all_complete_callback:
-            self.on_all_complete_callback()
+        self._post('all_complete')
+    
+    def stop_downloads_in_background(self) -> threading.Thread:
+        """Stop downloads on a worker thread, for shutdown; the UI is not updated"""
+        thread = threading.Thread(target=self.download_service.stop_downloads,
+                                  name='stop-downloads', daemon=True)
+        thread.start()
+        return thread
     
     def get_queue_status(self):
         """Get current queue status"""
@@ -112,73 +208,114 @@ class DownloadPresenter(ProgressListener):
     
     # ProgressListener implementation
     def on_progress(self, progress: DownloadProgress) -> None:
-        """Handle progress updates with throttling"""
-        if not self.on_progress_callback:
-            return
-            
-        # Implement throttling for UI updates
-        current_time = time.time()
-        playlist_id = progress.playlist_id
-        
-        # Initialize if not exists
-        if playlist_id not in self._last_progress_update:
-            self._last_progress_update[playlist_id] = 0
+        """Record the latest progress for its playlist; the UI thread picks it up in drain_progress"""
+        with self._pending_lock:
+            self._pending_progress[progress.playlist_id] = progress
+    
+    def drain_progress(self) -> bool:
+        """Deliver pending progress, status and events to the UI (call from the UI thread).
         
-        # Check if we should update UI based on time elapsed or status
-        should_update = False
+        Progress goes first so a tick queued before a playlist finished never lands after
+        its completion event. Only the latest status message is shown; progress is
+        throttled per playlist. Returns whether there was anything pending.
+        """
+        with self._pending_lock:
+            if not self._pending_progress and self._pending_status is None and not self._pending_events:
+                return False
+            pending, self._pending_progress = self._pending_progress, {}
+            status, self._pending_status = self._pending_status, None
+            events, self._pending_events = self._pending_events, []
         
-        # Always update for non-downloading statuses
-        if progress.status.value != 'downloading':
-            should_update = True
-        # Always update for the first update
-        elif self._last_progress_update[playlist_id] == 0:
-            should_update = True
-        # Update based on time interval
-        elif current_time - self._last_progress_update[playlist_id] >= self._progress_throttle_interval:
-            should_update = True
-        # Update on significant progress changes (e.g., 5% jumps)
-        elif hasattr(self, '_last_progress_value') and abs(progress.progress - getattr(self, '_last_progress_value', {}).get(playlist_id, 0)) >= 5:
-            should_update = True
+        callbacks = self.bus.subscribers('progress')
+        if pending and callbacks:
+            self._deliver_progress(pending, callbacks, events)
         
-        # Update UI if needed
-        if should_update:
-            self._last_progress_update[playlist_id] = current_time
-            
-            # Track last progress value
-            if not hasattr(self, '_last_progress_value'):
-                self._last_progress_value = {}
-            self._last_progress_value[playlist_id] = progress.progress
+        if status is not None:
+            self.bus.emit('status', status)
+        for event in events:
+            self._emit_event(*event)
+        return True
+    
+    def _deliver_progress(self, pending: Dict[str, DownloadProgress], callbacks, events: List[tuple]) -> None:
+        """Hand throttled progress to the UI callbacks; skipped updates are retried next drain"""
+        # Locals for the per-playlist loop
+        progress_state = self._progress_state
+        interval = self._progress_throttle_interval
+        now = time.monotonic()
+        skipped = {}
+        for playlist_id, progress in pending.items():
+            pct = progress.progress
+            state = progress_state.get(playlist_id)
             
-            # Call UI callback
-            self.on_progress_callback(progress)
+            # Update on the first event, any non-downloading status, once the interval has
+            # passed, or on a significant (5%) progress jump
+            if (state is None
+                    or progress.status is not DownloadStatus.DOWNLOADING
+                    or now - state[0] >= interval
+                    or abs(pct - state[1]) >= 5):
+                progress_state[playlist_id] = (now, pct)
+                progress_state.move_to_end(playlist_id)
+                if len(progress_state) > self.PROGRESS_STATE_MAX:
+                    progress_state.popitem(last=False)
+                for callback in callbacks:
+                    callback(progress)
+            else:
+                skipped[playlist_id] = progress
+        
+        # Throttled updates are retried on the next drain unless a newer one arrived,
+        # so the last update of a burst is never lost - except for playlists finishing
+        # in this batch, whose last tick would land after their completion
+        for event in events:
+            if event[0] in ('playlist_complete', 'playlist_failed'):
+                skipped.pop(event[1], None)
+        if skipped:
+            with self._pending_lock:
+                for playlist_id, progress in skipped.items():
+                    self._pending_progress.setdefault(playlist_id, progress)
     
     def on_download_start(self, playlist_id: str) -> None:
         """Handle download start"""
-        self._update_status(f"Starting download: {playlist_id}")
+        self._update_status("Starting download: %s", playlist_id)
     
     def on_download_complete(self, playlist_id: str) -> None:
         """Handle download completion"""
-        if self.on_playlist_complete_callback:
-            self.on_playlist_complete_callback(playlist_id)
-        self._update_status(f"Completed: {playlist_id}")
+        with self._pending_lock:
+            self._pending_progress.pop(playlist_id, None)  # Stale once the playlist is done
+        self._post('playlist_complete', playlist_id)
+        self._update_status("Completed: %s", playlist_id)
     
     def on_download_error(self, playlist_id: str, error: str) -> None:
         """Handle download error"""
-        if self.on_playlist_failed_callback:
-            self.on_playlist_failed_callback(playlist_id, error)
-        self._update_status(f"Failed: {playlist_id} - {error}")
-    
-    def _update_status(self, message: str) -> None:
-        """Update status message"""
-        self.logger.info(message)
-        if self.on_status_change_callback:
-            self.on_status_change_callback(message)
+        with self._pending_lock:
+            self._pending_progress.pop(playlist_id, None)  # Stale once the playlist is done
+        self._post('playlist_failed', playlist_id, error)
+        self._update_status("Failed: %s - %s", playlist_id, error)
+    
+    def _update_status(self, message: str, *args) -> None:
+        """Update status message; args are %-formatted into it only when needed"""
+        self.logger.info(message, *args)
+        
+        callbacks = self.bus.subscribers('status')
+        if not callbacks:
+            return
+        if args:
+            message = message % args
+        
+        # From the UI thread show it right away; from download threads leave it for
+        # drain_progress, so a burst of messages costs one repaint
+        if threading.current_thread() is threading.main_thread():
+            with self._pending_lock:
+                self._pending_status = None  # Superseded
+            for callback in callbacks:
+                callback(message)
+        else:
+            with self._pending_lock:
+                self._pending_status = message
 
     def on_all_downloads_complete(self) -> None:
         """Handle all downloads completion"""
         self._update_status("All downloads completed")
-        if self.on_all_complete_callback:
-            self.on_all_complete_callback()
+        self._post('all_complete')
 
     def is_downloading(self) -> bool:
         """
@@ -209,6 +346,8 @@ class DownloadPresenter(ProgressListener):
 class HistoryPresenter:
     """Presenter for history tab functionality"""
     
+    __slots__ = ('history_repository', 'logger')
+    
     def __init__(self, history_repository: HistoryRepository):
         self.history_repository = history_repository
         self.logger = get_logger(f"{__name__}.HistoryPresenter")
@@ -235,19 +374,32 @@ class HistoryPresenter:
             entry.playlist_id,
             entry.playlist_title,
             entry.status,
-            entry.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            entry.timestamp.isoformat(sep=' ', timespec='seconds'),
             entry.download_path
         )
+    
+    def format_history_entries(self, entries: List[HistoryEntry]) -> List[tuple]:
+        """Format history entries for display, newest first"""
+        # isoformat is much cheaper than strftime and gives the same text here
+        return [
+            (entry.playlist_id, entry.playlist_title, entry.status,
+             entry.timestamp.isoformat(sep=' ', timespec='seconds'), entry.download_path)
+            for entry in reversed(entries)
+        ]
 
 
 class SettingsPresenter:
     """Presenter for settings tab functionality"""
     
+    __slots__ = ('config_repository', 'cookie_validator', 'executor', 'logger')
+    
     def __init__(self, 
                  config_repository: ConfigurationRepository,
-                 cookie_validator):
+                 cookie_validator,
+                 executor: Optional[Executor] = None):
         self.config_repository = config_repository
         self.cookie_validator = cookie_validator
+        self.executor = executor or create_background_executor()
         self.logger = get_logger(f"{__name__}.SettingsPresenter")
     
     def load_config(self) -> DownloadConfig:
@@ -276,6 +428,19 @@ class SettingsPresenter:
             self.logger.error(f"Error saving configuration: {e}")
             return False
     
+    def save_config_async(self, config: DownloadConfig) -> Future:
+        """Validate and save configuration on a worker thread.
+        
+        The future resolves to (saved, validation errors).
+        """
+        return self.executor.submit(self._save_config_with_errors, config)
+    
+    def _save_config_with_errors(self, config: DownloadConfig) -> Tuple[bool, List[str]]:
+        """Save configuration and collect validation errors if it was rejected"""
+        if self.save_config(config):
+            return True, []
+        return False, self.cookie_validator.get_validation_errors()
+    
     def validate_cookies(self, method: str, file_path: Optional[str]) -> tuple[bool, List[str]]:
         """Validate cookie settings"""
         is_valid = self.cookie_validator.validate(method, file_path)
@@ -4,7 +4,7 @@ from typing import List, Optional
 import threading
 from urllib.parse import urlparse, parse_qs
 
-from src.data.models import DownloadProgress, DownloadQuality
+from src.data.models import DownloadProgress, DownloadQuality, DownloadStatus
 from src.ui.presenters import DownloadPresenter
 from src.ui.base_tab import BaseTab
 from src.utils.logging_utils import get_logger
@@ -17,11 +17,16 @@ class DownloadTab(BaseTab):
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
         
         self.presenter = presenter
-        self.presenter.on_progress_callback = self.update_progress
-        self.presenter.on_status_change_callback = self.update_status
-        self.presenter.on_playlist_complete_callback = self.mark_playlist_complete
-        self.presenter.on_playlist_failed_callback = self.mark_playlist_failed
-        self.presenter.on_all_complete_callback = self.reset_ui
+        self._subscriptions = (
+            ('progress', self.update_progress),
+            ('status', self.update_status),
+            ('playlist_complete', self.mark_playlist_complete),
+            ('playlist_failed', self.mark_playlist_failed),
+            ('all_complete', self.reset_ui),
+            ('start_failed', self.reset_ui),
+        )
+        for event, callback in self._subscriptions:
+            self.presenter.bus.subscribe(event, callback)
 
         # Variables
         self.config = self.presenter.load_config()
@@ -411,7 +416,8 @@ class DownloadTab(BaseTab):
         
         self.logger.info(f"Starting downloads for {len(playlist_ids)} playlist(s)")
         
-        # Start downloads
+        # Start downloads; if starting fails in the background the presenter
+        # raises 'start_failed', which resets these controls
         if self.presenter.start_downloads_quick(playlist_ids, quick_config):
             self.download_button.config(state=tk.DISABLED)
             self.pause_button.config(state=tk.NORMAL)
@@ -480,24 +486,25 @@ class DownloadTab(BaseTab):
         import time
         import os
         current_time = time.time()
+        downloading = progress.status is DownloadStatus.DOWNLOADING
         
         # Throttle updates
         if (hasattr(self, '_last_progress_time') and 
             current_time - self._last_progress_time < 0.5 and
-            progress.status.value == 'downloading'):
+            downloading):
             return
             
         self._last_progress_time = current_time
         
         # Update progress bar
-        if progress.status.value == 'downloading':
+        if downloading:
             if self.progress_bar.cget('mode') == 'indeterminate':
                 self.progress_bar.stop()
                 self.progress_bar.config(mode='determinate')
             self.progress_bar['value'] = progress.progress
         
         # Update status
-        if progress.status.value == 'downloading':
+        if downloading:
             speed_mb = progress.speed / 1024 / 1024 if progress.speed else 0
             
             if progress.eta and progress.eta < 100000:
@@ -638,4 +645,10 @@ class DownloadTab(BaseTab):
         self.current_track_label.config(text="None")
         
         # Clear log tree
-        self.log_tree.delete(*self.log_tree.get_children())
\ No newline at end of file
+        self.log_tree.delete(*self.log_tree.get_children())
+    
+    def destroy(self):
+        """Stop receiving presenter events before the widgets go away"""
+        for event, callback in self._subscriptions:
+            self.presenter.bus.unsubscribe(event, callback)
+        super().destroy()
@@ -58,16 +58,17 @@ class HistoryTab(BaseTab):
     
     def refresh_history(self):
         """Refresh history display"""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        tree = self.history_tree
         
-        # Load and display history
-        history = self.presenter.get_history()
+        # Clear existing items in a single call
+        tree.delete(*tree.get_children())
         
-        for entry in reversed(history):  # Show newest first
-            formatted_entry = self.presenter.format_history_entry(entry)
-            self.history_tree.insert('', 'end', values=formatted_entry)
+        # Load and display history (newest first)
+        rows = self.presenter.format_history_entries(self.presenter.get_history())
+        
+        insert = tree.insert
+        for values in rows:
+            insert('', 'end', values=values)
     
     def clear_history(self):
         """Clear download history"""
@@ -10,6 +10,8 @@ from src.utils.logging_utils import get_logger
 class SettingsTab(BaseTab):
     """Enhanced settings tab implementation with output template options"""
     
+    SAVE_POLL_MS = 50  # How often a pending save is checked
+    
     def __init__(self, parent, presenter: SettingsPresenter, **kwargs):
         # Get tab-specific logger
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
@@ -74,8 +76,9 @@ class SettingsTab(BaseTab):
         self._create_performance_section(self.performance_tab)
         
         # Save button (common to all tabs)
-        tk.Button(settings_frame, text="Save Settings", command=self.save_settings, 
-                 bg="#2196F3", fg="white").pack(pady=10)
+        self.save_button = tk.Button(settings_frame, text="Save Settings", command=self.save_settings, 
+                                     bg="#2196F3", fg="white")
+        self.save_button.pack(pady=10)
     
     def _create_cookie_section(self, parent):
         """Create cookie settings section"""
@@ -448,8 +451,20 @@ class SettingsTab(BaseTab):
         if self.config.quick_mode:
             self.config.skip_validation = True
         
-        if self.presenter.save_config(self.config):
+        # Cookie validation can be slow, so validate and save off the UI thread
+        self.save_button.config(state=tk.DISABLED)
+        future = self.presenter.save_config_async(self.config.copy())
+        self.after(self.SAVE_POLL_MS, self._poll_save, future)
+    
+    def _poll_save(self, future):
+        """Report the result of an asynchronous save once it is done"""
+        if not future.done():
+            self.after(self.SAVE_POLL_MS, self._poll_save, future)
+            return
+        
+        self.save_button.config(state=tk.NORMAL)
+        saved, errors = future.result()
+        if saved:
             messagebox.showinfo("Settings Saved", "All settings have been saved successfully")
         else:
-            errors = self.presenter.cookie_validator.get_validation_errors()
-            messagebox.showerror("Validation Error", "\n".join(errors))
\ No newline at end of file
+            messagebox.showerror("Validation Error", "\n".join(errors) or "Settings could not be saved")
\ No newline at end of file
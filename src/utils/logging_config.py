@@ -6,10 +6,13 @@ For a windowed application, we keep console output minimal (WARNING and above)
 while maintaining detailed file logs for troubleshooting.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Default logging levels
 CONSOLE_LEVEL = logging.WARNING  # Only warnings and errors to console
@@ -18,6 +21,39 @@ FILE_LEVEL = logging.DEBUG       # Everything goes to file
 # Log file location
 DEFAULT_LOG_FILE = "logs/youtube_downloader.log"
 
+# Records are handed to a background thread that does the formatting and I/O, so
+# logging from the UI and download threads never waits on the disk or console
+_listener: Optional[QueueListener] = None
+
+
+def _start_listener(handlers: List[logging.Handler]) -> None:
+    """Route root logger output through a queue to the given handlers"""
+    global _listener
+    _stop_listener()
+    
+    log_queue = queue.SimpleQueue()
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Stop the background listener, writing out anything still queued"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def _output_handlers() -> List[logging.Handler]:
+    """Handlers that actually write log output"""
+    if _listener is not None:
+        return list(_listener.handlers)
+    return logging.getLogger().handlers
+
 
 def setup_logging(
     console_level: int = CONSOLE_LEVEL,
@@ -46,9 +82,14 @@ def setup_logging(
     root_logger.setLevel(logging.DEBUG)  # Capture everything at root level
     
     # IMPORTANT: Clear ALL existing handlers first
+    previous_handlers = _output_handlers()
+    _stop_listener()  # Writes out anything still queued before the handlers close
+    for handler in previous_handlers:
+        handler.close()
     for handler in root_logger.handlers[:]:
         handler.close()
         root_logger.removeHandler(handler)
+    handlers = []
     
     # File handler - detailed logging
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -58,7 +99,7 @@ def setup_logging(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
     
     # Console handler - minimal logging (unless quiet mode)
     if not quiet_mode:
@@ -68,7 +109,9 @@ def setup_logging(
             '%(levelname)s: %(message)s'  # Simpler format for console
         )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    _start_listener(handlers)
     
     # Silence noisy third-party libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -100,8 +143,7 @@ def set_console_level(level: int) -> None:
     Args:
         level: New logging level (logging.DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers:
+    for handler in _output_handlers():
         if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
             handler.setLevel(level)
 
@@ -114,6 +156,19 @@ def enable_debug_mode() -> None:
 
 def enable_quiet_mode() -> None:
     """Disable all console logging"""
+    if _listener is not None:
+        # Restart the listener without the console handler
+        handlers = [
+            handler for handler in _listener.handlers
+            if not (isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout)
+        ]
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                root_logger.removeHandler(handler)
+        _start_listener(handlers)
+        return
+    
     root_logger = logging.getLogger()
     for handler in list(root_logger.handlers):
         if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
@@ -34,6 +34,9 @@ def setup_logging(logs_dir: str = "logs",
     if _logging_configured and not force:
         return logging.getLogger()
     
+    # Imported here - logging_config imports this module
+    from src.utils.logging_config import _output_handlers, _start_listener, _stop_listener
+    
     # Create logs directory if it doesn't exist
     os.makedirs(logs_dir, exist_ok=True)
     
@@ -49,14 +52,18 @@ def setup_logging(logs_dir: str = "logs",
     root_logger.setLevel(numeric_level)
     
     # Remove existing handlers to avoid duplicates when called multiple times
+    previous_handlers = _output_handlers()
+    _stop_listener()  # Writes out anything still queued before the handlers close
+    for handler in previous_handlers:
+        handler.close()
     for handler in root_logger.handlers[:]:
+        handler.close()
         root_logger.removeHandler(handler)
     
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
     
     # Create file handler with rotation
     log_path = os.path.join(logs_dir, log_file)
@@ -67,7 +74,9 @@ def setup_logging(logs_dir: str = "logs",
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    
+    # Loggers only enqueue records; a background listener does the console and file I/O
+    _start_listener([console_handler, file_handler])
     
     # Log startup message
     root_logger.info(f"Logging configured with level {log_level} to {log_path}")
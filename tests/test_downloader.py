@@ -0,0 +1,132 @@
+import logging
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+# The pool is exercised with a fake YoutubeDL; yt-dlp itself is only needed to import
+try:
+    import yt_dlp  # noqa: F401
+except ImportError:
+    sys.modules['yt_dlp'] = types.SimpleNamespace(YoutubeDL=None)
+
+from src.core import downloader
+from src.core.downloader import YouTubePlaylistDownloader
+from src.core.validators import QualityFormatter
+from src.data.models import DownloadConfig, PlaylistInfo
+
+
+class FakeYoutubeDL:
+    """Records construction, hooks and close() like a YoutubeDL would expose them"""
+
+    def __init__(self, params):
+        self.params = dict(params)
+        self._progress_hooks = list(params.get('progress_hooks', []))
+        self.closed = False
+
+    def add_progress_hook(self, hook):
+        self._progress_hooks.append(hook)
+
+    def download(self, urls):
+        return 0
+
+    def close(self):
+        self.closed = True
+
+
+class PooledYoutubeDLTest(unittest.TestCase):
+    """Reuse and eviction of pooled YoutubeDL instances"""
+
+    def setUp(self):
+        patcher = mock.patch.object(downloader, 'YoutubeDL', FakeYoutubeDL)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.downloader = YouTubePlaylistDownloader(
+            quality_formatter=QualityFormatter(),
+            filename_sanitizer=None,
+            cookie_validator=None,
+            history_repository=None,
+            logger=logging.getLogger(__name__)
+        )
+        self.addCleanup(self.downloader.close_pooled)
+
+    def download_opts(self, index):
+        """Options shaped like the download paths build them"""
+        return {
+            'format': 'bestvideo+bestaudio/best',
+            'logger': self.downloader._ydl_logger,
+            'outtmpl': f"/downloads/{index}/%(title)s.%(ext)s",
+            'progress_hooks': [lambda d: None],
+        }
+
+    def test_consecutive_downloads_reuse_one_instance(self):
+        used = []
+        for index in range(5):
+            with self.downloader._pooled_ydl(self.download_opts(index)) as ydl:
+                used.append(ydl)
+
+        self.assertEqual(len({id(ydl) for ydl in used}), 1)
+        self.assertEqual(len(self.downloader._ydl_cache), 1)
+
+    def test_quick_downloads_reuse_one_instance(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        config = DownloadConfig(download_directory=folder)
+
+        for index in range(5):
+            playlist = PlaylistInfo(
+                id=f"PL{index}", title=f"Playlist {index}",
+                url=f"https://www.youtube.com/playlist?list=PL{index}",
+                total_tracks=0, entries=[]
+            )
+            self.downloader._download_playlist_quick(playlist, folder, config, None)
+
+        idle = [ydl for instances in self.downloader._ydl_cache.values() for ydl in instances]
+        self.assertEqual(len(self.downloader._ydl_cache), 1)
+        self.assertEqual(len(idle), 1)
+
+    def test_per_call_options_are_reapplied(self):
+        with self.downloader._pooled_ydl(self.download_opts(1)):
+            pass
+        hook = lambda d: None
+        opts = dict(self.download_opts(2), progress_hooks=[hook])
+        with self.downloader._pooled_ydl(opts) as ydl:
+            self.assertEqual(ydl.params['outtmpl'], {'default': opts['outtmpl']})
+            self.assertEqual(ydl._progress_hooks, [hook])
+
+        # Hooks are dropped once the instance is back in the pool
+        self.assertEqual(ydl._progress_hooks, [])
+
+    def test_extra_idle_instances_are_closed(self):
+        opts = self.download_opts(0)
+        limit = downloader._YDL_POOL_MAX_IDLE
+        borrowed = [self.downloader._pooled_ydl(opts) for _ in range(limit + 1)]
+        instances = [context.__enter__() for context in borrowed]
+        for context in borrowed:
+            context.__exit__(None, None, None)
+
+        self.assertEqual(len({id(ydl) for ydl in instances}), limit + 1)
+        self.assertEqual(sum(ydl.closed for ydl in instances), 1)
+        self.assertEqual(len(next(iter(self.downloader._ydl_cache.values()))), limit)
+
+    def test_failed_call_closes_instance(self):
+        with self.assertRaises(RuntimeError):
+            with self.downloader._pooled_ydl(self.download_opts(0)) as ydl:
+                raise RuntimeError("download failed")
+
+        self.assertTrue(ydl.closed)
+        self.assertEqual(sum(map(len, self.downloader._ydl_cache.values())), 0)
+
+    def test_close_pooled_closes_idle_instances(self):
+        with self.downloader._pooled_ydl(self.download_opts(0)) as ydl:
+            pass
+        self.downloader.close_pooled()
+
+        self.assertTrue(ydl.closed)
+        self.assertEqual(self.downloader._ydl_cache, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.data.models import DownloadProgress, DownloadStatus
+from src.ui.presenters import DownloadPresenter
+
+
+def make_progress(playlist_id, pct, status=DownloadStatus.DOWNLOADING):
+    """Progress tick as the downloader reports it"""
+    return DownloadProgress(
+        playlist_id=playlist_id, status=status, progress=pct,
+        speed=0.0, eta=0, current_file="", message=""
+    )
+
+
+def run_on_worker(target):
+    """Call target on a non-UI thread, the way download workers do"""
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+
+
+class DownloadPresenterDrainTest(unittest.TestCase):
+    """Order and throttling of what drain_progress hands to the UI"""
+
+    def setUp(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        self.presenter = DownloadPresenter(
+            download_service=mock.Mock(), config_repository=mock.Mock(),
+            history_repository=mock.Mock(), executor=executor
+        )
+        self.delivered = []
+        for event in ('progress', 'status', 'playlist_complete', 'playlist_failed', 'all_complete'):
+            self.presenter.bus.subscribe(event, lambda *args, event=event: self.delivered.append(event))
+
+    def test_progress_is_delivered_before_completion(self):
+        def worker():
+            self.presenter.on_progress(make_progress('a', 99))
+            self.presenter.on_all_downloads_complete()
+        run_on_worker(worker)
+        self.presenter.drain_progress()
+
+        self.assertEqual(self.delivered, ['progress', 'status', 'all_complete'])
+
+    def test_finished_playlist_drops_pending_progress(self):
+        def worker():
+            self.presenter.on_progress(make_progress('a', 99))
+            self.presenter.on_download_complete('a')
+            self.presenter.on_all_downloads_complete()
+        run_on_worker(worker)
+        self.presenter.drain_progress()
+
+        self.assertEqual(self.delivered, ['status', 'playlist_complete', 'all_complete'])
+        self.assertFalse(self.presenter.drain_progress())
+
+    def test_throttle_state_dropped_when_finish_is_delivered(self):
+        run_on_worker(lambda: self.presenter.on_progress(make_progress('a', 10)))
+        self.presenter.drain_progress()
+        run_on_worker(lambda: self.presenter.on_download_complete('a'))
+
+        # The worker leaves the UI-thread state alone; the drain clears it
+        self.assertIn('a', self.presenter._progress_state)
+        self.presenter.drain_progress()
+        self.assertNotIn('a', self.presenter._progress_state)
+
+    def test_throttled_progress_is_retried(self):
+        run_on_worker(lambda: self.presenter.on_progress(make_progress('a', 10)))
+        self.presenter.drain_progress()
+        run_on_worker(lambda: self.presenter.on_progress(make_progress('a', 11)))
+        self.presenter.drain_progress()
+
+        # Skipped by the throttle, but kept for a later drain
+        self.assertEqual(self.delivered, ['progress'])
+        self.assertTrue(self.presenter.drain_progress())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from src.data import repositories
+from src.data.repositories import OptimizedJsonHistoryRepository
+
+
+def make_entry(playlist_id, status='completed', title=None):
+    """History entry dict as the downloader saves it"""
+    return {
+        'playlist_id': playlist_id,
+        'playlist_title': title or f"Playlist {playlist_id}",
+        'status': status,
+        'timestamp': datetime(2024, 1, 1, 12, 0, 0).isoformat(),
+        'download_path': f"/downloads/{playlist_id}"
+    }
+
+
+class OptimizedJsonHistoryRepositoryTest(unittest.TestCase):
+    """Append-only history log: replay, compaction and clearing"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.history_file = os.path.join(self.temp_dir, "download_history.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_lines(self):
+        with open(self.history_file, 'rb') as f:
+            return f.read().splitlines()
+
+    def test_replay_after_appending(self):
+        repo = OptimizedJsonHistoryRepository(self.history_file)
+        repo.save_entry_dict(make_entry('a'))
+        repo.save_entry_dict(make_entry('b'))
+        repo.flush()
+        repo.save_entry_dict(make_entry('a', status='failed'))
+        repo.flush()
+
+        # Every save is appended; nothing is rewritten yet
+        self.assertEqual(len(self.read_lines()), 3)
+
+        reloaded = OptimizedJsonHistoryRepository(self.history_file)
+        statuses = {entry.playlist_id: entry.status for entry in reloaded.load_history()}
+        self.assertEqual(statuses, {'a': 'failed', 'b': 'completed'})
+        self.assertFalse(reloaded.is_duplicate('a'))
+        self.assertTrue(reloaded.is_duplicate('b'))
+
+    def test_compaction_keeps_newest_entry_per_playlist(self):
+        repo = OptimizedJsonHistoryRepository(self.history_file)
+        repo.save_entry_dict(make_entry('a', title="First"))
+        repo.save_entry_dict(make_entry('b'))
+        repo.flush()
+
+        # Any growth past the last compacted size triggers a rewrite
+        with mock.patch.object(repositories, '_COMPACT_SLACK', 0):
+            repo._last_compact_size = 0
+            repo.save_entry_dict(make_entry('a', title="Second"))
+            repo.flush()
+
+        self.assertEqual(len(self.read_lines()), 2)
+        reloaded = OptimizedJsonHistoryRepository(self.history_file)
+        titles = {entry.playlist_id: entry.playlist_title for entry in reloaded.load_history()}
+        self.assertEqual(titles, {'a': "Second", 'b': "Playlist b"})
+
+    def test_compaction_includes_evicted_entries(self):
+        repo = OptimizedJsonHistoryRepository(self.history_file, max_cache=1)
+        repo.save_entry_dict(make_entry('a'))
+        repo.save_entry_dict(make_entry('b'))
+        repo.flush()
+
+        with mock.patch.object(repositories, '_COMPACT_SLACK', 0):
+            repo._last_compact_size = 0
+            repo.save_entry_dict(make_entry('c'))
+            repo.flush()
+
+        reloaded = OptimizedJsonHistoryRepository(self.history_file)
+        self.assertEqual(sorted(e.playlist_id for e in reloaded.load_history()), ['a', 'b', 'c'])
+
+    def test_unreadable_records_reported_once_and_compacted(self):
+        repo = OptimizedJsonHistoryRepository(self.history_file)
+        repo.save_entry_dict(make_entry('a'))
+        repo.flush()
+        with open(self.history_file, 'ab') as f:
+            f.write(b'{"torn\n' * 3)
+
+        with mock.patch('builtins.print') as printed:
+            reloaded = OptimizedJsonHistoryRepository(self.history_file)
+            self.assertTrue(reloaded.is_duplicate('a'))
+        printed.assert_called_once_with("Skipped 3 unreadable history record(s)")
+
+        reloaded.flush()
+        self.assertEqual(len(self.read_lines()), 1)
+
+    def test_clear_history_then_reload(self):
+        repo = OptimizedJsonHistoryRepository(self.history_file)
+        repo.save_entry_dict(make_entry('a'))
+        repo.flush()
+
+        repo.clear_history()
+        self.assertFalse(repo.is_duplicate('a'))
+        repo.flush()
+        self.assertEqual(OptimizedJsonHistoryRepository(self.history_file).load_history(), [])
+
+        # Saves after clearing are appended to the emptied log
+        repo.save_entry_dict(make_entry('b'))
+        repo.flush()
+        reloaded = OptimizedJsonHistoryRepository(self.history_file)
+        self.assertEqual([e.playlist_id for e in reloaded.load_history()], ['b'])
+        self.assertFalse(reloaded.is_duplicate('a'))
+
+    def test_clear_history_drops_unwritten_entries(self):
+        repo = OptimizedJsonHistoryRepository(self.history_file)
+        repo.save_entry_dict(make_entry('a'))
+        repo.clear_history()
+        repo.flush()
+
+        self.assertEqual(OptimizedJsonHistoryRepository(self.history_file).load_history(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()